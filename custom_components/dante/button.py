@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, LOGGER
@@ -19,24 +20,24 @@ async def async_setup_entry(
     """Set up Dante button entities."""
     coordinator: DanteDataUpdateCoordinator = entry.runtime_data
     platform = "button"
-    coordinator.setdefault_known_devices(platform)
 
+    @callback
     def _add_new_devices() -> None:
         """Add entities for any newly discovered devices."""
-        if not coordinator.data:
-            return
         new_entities: list[ButtonEntity] = []
-        for device_name in coordinator.data:
-            if device_name not in coordinator._platform_known_devices[platform]:
-                coordinator._platform_known_devices[platform].add(device_name)
-                new_entities.append(
-                    DanteIdentifyButton(coordinator, device_name)
-                )
+        for device_name in coordinator.take_new_devices(platform):
+            new_entities.append(
+                DanteIdentifyButton(coordinator, device_name)
+            )
         if new_entities:
-            async_add_entities(new_entities, update_before_add=True)
+            async_add_entities(new_entities)
 
     _add_new_devices()
-    entry.async_on_unload(coordinator.async_add_listener(lambda: _add_new_devices()))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, coordinator.new_devices_signal, _add_new_devices
+        )
+    )
 
 
 class DanteIdentifyButton(DanteEntity, ButtonEntity):
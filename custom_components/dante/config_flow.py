@@ -1,7 +1,6 @@
 """Config flow for Dante Audio Network."""
 from __future__ import annotations
 
-import asyncio
 from typing import Any
 
 import voluptuous as vol
@@ -10,11 +9,8 @@ from homeassistant import config_entries
 from homeassistant.components import zeroconf
 from homeassistant.data_entry_flow import FlowResult
 
-from zeroconf import ServiceStateChange
-from zeroconf.asyncio import AsyncServiceBrowser, AsyncServiceInfo
-
 from .const import DOMAIN, LOGGER, MDNS_TIMEOUT
-from .netaudio.const import SERVICES
+from .coordinator import browse_once
 
 
 class DanteConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -43,67 +39,14 @@ class DanteConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         try:
             aiozc = await zeroconf.async_get_async_instance(self.hass)
-            found_services: list[tuple[str, str]] = []
-
-            def on_state_change(
-                zeroconf: object,
-                service_type: str,
-                name: str,
-                state_change: ServiceStateChange,
-            ) -> None:
-                if state_change is ServiceStateChange.Added:
-                    found_services.append((service_type, name))
-
-            browser = AsyncServiceBrowser(
-                aiozc.zeroconf,
-                SERVICES,
-                handlers=[on_state_change],
-            )
-
-            await asyncio.sleep(MDNS_TIMEOUT)
-            await browser.async_cancel()
-
-            LOGGER.warning("Dante: browse found %d services", len(found_services))
-
-            # Resolve each service
-            device_hosts: dict[str, dict] = {}
-            for service_type, name in found_services:
-                try:
-                    info = AsyncServiceInfo(service_type, name)
-                    if not await info.async_request(aiozc.zeroconf, 3000):
-                        continue
-
-                    addresses = info.parsed_addresses()
-                    if not addresses:
-                        continue
-
-                    ipv4 = addresses[0]
-                    props = {}
-                    for k, v in info.properties.items():
-                        k = k.decode("utf-8") if isinstance(k, bytes) else k
-                        v = v.decode("utf-8") if isinstance(v, bytes) else v
-                        props[k] = v
-
-                    server_name = info.server or name.split(".")[0]
-
-                    if server_name not in device_hosts:
-                        device_hosts[server_name] = {
-                            "ipv4": ipv4,
-                            "model": "Unknown",
-                        }
-
-                    if "model" in props:
-                        device_hosts[server_name]["model"] = props["model"]
-
-                except Exception as err:
-                    LOGGER.debug("Error resolving %s: %s", name, err)
+            device_hosts = await browse_once(aiozc, MDNS_TIMEOUT)
 
-            LOGGER.warning("Dante: found %d devices", len(device_hosts))
+            LOGGER.debug("Dante: found %d devices", len(device_hosts))
 
             self._discovered_devices = {
                 name: {
                     "name": name,
-                    "model": data["model"],
+                    "model": data["props"].get("model", "Unknown"),
                     "ipv4": data["ipv4"],
                 }
                 for name, data in device_hosts.items()
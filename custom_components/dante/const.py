@@ -1,46 +1,63 @@
 """Constants for the Dante Audio Network integration."""
 import logging
+from types import MappingProxyType
 
 DOMAIN = "dante"
 LOGGER = logging.getLogger(__package__)
 
 SCAN_INTERVAL = 30
 MDNS_TIMEOUT = 5.0
+MDNS_RESOLVE_CONCURRENCY = 16  # max mDNS service resolves in flight at once
+MDNS_SETTLE_TIME = 1.0  # one-shot browse ends once no new service arrived for this long
+DEVICE_QUERY_CONCURRENCY = 16  # max devices queried by unicast at once
+SETTER_REFRESH_COOLDOWN = 0.5  # seconds; setter-triggered refreshes in this window coalesce
 DEVICE_MISS_LIMIT = 10  # drop device after this many consecutive missed discovery cycles (~5 min)
 
-PLATFORMS = ["sensor", "select", "number", "switch", "button"]
+PLATFORMS = ("sensor", "select", "number", "switch", "button")
 
-SAMPLE_RATES = [44100, 48000, 88200, 96000, 176400, 192000]
-SAMPLE_RATE_LABELS = {
+# Dispatched once per update in which devices were seen for the first time;
+# formatted with the config entry ID
+SIGNAL_NEW_DEVICES = f"{DOMAIN}_new_devices_{{}}"
+
+SAMPLE_RATES = (44100, 48000, 88200, 96000, 176400, 192000)
+SAMPLE_RATE_LABELS = MappingProxyType({
     44100: "44.1 kHz",
     48000: "48 kHz",
     88200: "88.2 kHz",
     96000: "96 kHz",
     176400: "176.4 kHz",
     192000: "192 kHz",
-}
+})
+SAMPLE_RATE_BY_LABEL = MappingProxyType(
+    {label: rate for rate, label in SAMPLE_RATE_LABELS.items()}
+)
 
-ENCODINGS = [16, 24, 32]
-ENCODING_LABELS = {16: "PCM 16-bit", 24: "PCM 24-bit", 32: "PCM 32-bit"}
+ENCODINGS = (16, 24, 32)
+ENCODING_LABELS = MappingProxyType(
+    {16: "PCM 16-bit", 24: "PCM 24-bit", 32: "PCM 32-bit"}
+)
+ENCODING_BY_LABEL = MappingProxyType(
+    {label: encoding for encoding, label in ENCODING_LABELS.items()}
+)
 
-GAIN_LABELS_INPUT = {
+GAIN_LABELS_INPUT = MappingProxyType({
     1: "+24 dBu",
     2: "+4 dBu",
     3: "+0 dBu",
     4: "0 dBV",
     5: "-10 dBV",
-}
+})
 
-GAIN_LABELS_OUTPUT = {
+GAIN_LABELS_OUTPUT = MappingProxyType({
     1: "+18 dBu",
     2: "+4 dBu",
     3: "+0 dBu",
     4: "0 dBV",
     5: "-10 dBV",
-}
+})
 
-AVIO_INPUT_MODELS = ["DAI1", "DAI2"]
-AVIO_OUTPUT_MODELS = ["DAO1", "DAO2"]
+AVIO_INPUT_MODELS = ("DAI1", "DAI2")
+AVIO_OUTPUT_MODELS = ("DAO1", "DAO2")
 
 SUBSCRIPTION_NONE = "None"
 
@@ -2,29 +2,315 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 from datetime import timedelta
-import select as sel
+import re
 import socket
 import struct
+import sys
+import threading
 import time
 from typing import Any
 
 from homeassistant.components import zeroconf
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 
-from zeroconf import ServiceStateChange
-from zeroconf.asyncio import AsyncServiceBrowser, AsyncServiceInfo
+from zeroconf import DNSQuestionType, ServiceStateChange
+from zeroconf.asyncio import AsyncServiceBrowser, AsyncServiceInfo, AsyncZeroconf
 
-from .const import DOMAIN, LOGGER, MDNS_TIMEOUT, DEVICE_MISS_LIMIT, SAP_MULTICAST, SAP_PORT, SAP_TIMEOUT, SCAN_INTERVAL
-from .netaudio.const import SERVICE_CMC, SERVICES
+from .const import DEVICE_QUERY_CONCURRENCY, DOMAIN, LOGGER, MDNS_RESOLVE_CONCURRENCY, MDNS_SETTLE_TIME, MDNS_TIMEOUT, DEVICE_MISS_LIMIT, SAP_MULTICAST, SAP_PORT, SAP_TIMEOUT, SCAN_INTERVAL, SETTER_REFRESH_COOLDOWN, SIGNAL_NEW_DEVICES, SUBSCRIPTION_NONE
+from .netaudio.const import SERVICES
 from .netaudio.device import DanteDevice
 
 
-class DanteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+# Service types to browse, de-duplicated so overlapping entries never get a
+# second PTR query. Kept a list: ServiceBrowser only expands lists.
+_BROWSE_TYPES: list[str] = list(dict.fromkeys(SERVICES))
+
+# Seconds a bind-IP routing probe is reused before re-probing
+_BIND_IP_CACHE_TTL = 60.0
+
+
+def _build_aes67_template() -> bytes:
+    """Build the constant part of the 112-byte 0x3201 AES67 subscribe command."""
+    pkt = bytearray(112)
+    # Header (sequence number at offset 4 is filled per command)
+    struct.pack_into(">2sH2x2s", pkt, 0, b"\x28\x09", 112, b"\x32\x01")
+    # Flags/version
+    pkt[10:14] = b"\x01\x01\x00\x10"
+    for offset, value in (
+        (18, 0x4202),  # Record type
+        (28, 0x0001),  # Record count
+        (34, 0x0068),  # Offset
+        (44, 0x0003),  # Sub-record structure
+        (46, 0x0040),
+        (52, 0x0002),
+        (54, 0x0060),
+        (64, 0x1000),  # Flow source info
+        (66, 0x000B),
+    ):
+        struct.pack_into(">H", pkt, offset, value)
+    return bytes(pkt)
+
+
+# SDP fields used for AES67 streams: s=, o=, c=, m=, i= and the value of
+# a=rtpmap after the payload type (e.g. "L24/48000/2")
+_SDP_FIELD_RE = re.compile(
+    r"^[ \t]*(?:([socmi])=|a=rtpmap:\S*[ ])(.*?)[ \t\r]*$", re.MULTILINE
+)
+
+# SAP socket receive buffer (the kernel caps it at net.core.rmem_max)
+_SAP_RCVBUF = 1 << 20
+# Linux socket option; not exported by the socket module
+_IP_MULTICAST_ALL = getattr(socket, "IP_MULTICAST_ALL", 49)
+
+# SAP header: flags byte (version/address type/message type), auth length
+_SAP_HEADER = struct.Struct(">BB")
+
+_AES67_TEMPLATE = _build_aes67_template()
+# Per-command fields: sequence (offset 4), flow source (68), channel map (96)
+_AES67_SEQ = struct.Struct(">H")
+_AES67_FLOW_SOURCE = struct.Struct(">4s4xI")
+_AES67_CHANNEL_MAP = struct.Struct(">HHxxBxBBH4s")
+# Subscribe response: magic (0x2801) and status (1 = success) at offset 8
+_AES67_RESPONSE = struct.Struct(">H6xH")
+
+# mDNS TXT property -> DanteDevice attribute, with the cast applied
+_PROP_SETTERS: tuple[tuple[str, str, Callable[[str], Any]], ...] = (
+    ("id", "mac_address", str),
+    ("model", "model_id", str),
+    ("rate", "sample_rate", int),
+    ("latency_ns", "latency", int),
+)
+
+
+@dataclass(slots=True)
+class DanteDeviceSnapshot:
+    """Point-in-time view of one Dante device, as stored in coordinator.data."""
+
+    server_name: str
+    name: str
+    ipv4: str | None = None
+    mac_address: str | None = None
+    manufacturer: str | None = None
+    model: str | None = None
+    model_id: str | None = None
+    software: str | None = None
+    sample_rate: int | None = None
+    latency: int | None = None
+    rx_count: int = 0
+    tx_count: int = 0
+    # {number: {"name", "number"}}
+    rx_channels: dict[int, dict[str, Any]] = field(default_factory=dict)
+    tx_channels: dict[int, dict[str, Any]] = field(default_factory=dict)
+    # [{"rx_channel_name", "tx_channel_name", "tx_device_name", "status_code"}]
+    subscriptions: list[dict[str, Any]] = field(default_factory=list)
+    # rx_channel_name -> first subscription with a TX device and channel set
+    subscriptions_by_rx: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class DanteCoordinatorData:
+    """Everything the coordinator publishes as coordinator.data.
+
+    AES67 streams and selections are kept on the coordinator, not in a
+    snapshot; ``aes67_version`` takes part in equality so a change to them
+    counts as a data change under always_update=False.
+    """
+
+    # Device name -> snapshot
+    devices: dict[str, DanteDeviceSnapshot]
+    aes67_version: int = 0
+
+
+def _server_name_from_service(name: str) -> str:
+    """Extract the Dante device name from the mDNS service name.
+
+    Always uses the service name prefix (the Dante device name set in
+    Dante Controller) rather than info.server (hardware hostname).
+    Dante device names are guaranteed unique on the network and are
+    what users expect to see. Hardware hostnames can be generic or
+    short (e.g. "2") which caused device merges in the HA registry.
+    """
+    return name.partition(".")[0]
+
+
+def _inet_aton_or_none(address: str | None) -> bytes | None:
+    """Pack a dotted IPv4 address, or return None if it is missing or invalid."""
+    if not address:
+        return None
+    try:
+        return socket.inet_aton(address)
+    except OSError:
+        return None
+
+
+def _decode_str(value: bytes | str | None) -> str:
+    """Decode a single TXT key or value to str."""
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "replace")
+    return value or ""
+
+
+def _decode_props(raw: dict) -> dict[str, str]:
+    """Decode mDNS TXT properties to a str -> str dict."""
+    return {_decode_str(k): _decode_str(v) for k, v in raw.items()}
+
+
+async def async_resolve_service(
+    aiozc: AsyncZeroconf,
+    service_type: str,
+    name: str,
+    question_type: DNSQuestionType | None = None,
+    previous: dict[str, Any] | None = None,
+) -> dict[str, Any] | None:
+    """Resolve a single mDNS service into a record dict.
+
+    async_request answers from zeroconf's record cache when it is still
+    warm and only goes to the network for missing records. When the raw
+    TXT record matches ``previous``, its decoded properties are reused.
+
+    Returns {type, server_name, ipv4, port, properties, txt}, or None if
+    the service did not resolve to an address.
+    """
+    info = AsyncServiceInfo(service_type, name)
+    if not await info.async_request(
+        aiozc.zeroconf, 3000, question_type=question_type
+    ):
+        return None
+
+    addresses = info.parsed_addresses()
+    if not addresses:
+        return None
+
+    txt = info.text
+    if previous is not None and previous["txt"] == txt:
+        properties = previous["properties"]
+    else:
+        properties = _decode_props(info.properties)
+
+    return {
+        "type": service_type,
+        "server_name": _server_name_from_service(name),
+        "ipv4": addresses[0],
+        "port": info.port,
+        "properties": properties,
+        "txt": txt,
+    }
+
+
+def group_records_by_host(records: dict[str, dict[str, Any]]) -> dict[str, dict]:
+    """Group resolved service records (keyed by service name) by device."""
+    hosts: dict[str, dict] = {}
+
+    for name, record in records.items():
+        server_name = record["server_name"]
+        if server_name not in hosts:
+            hosts[server_name] = {
+                "ipv4": record["ipv4"],
+                "services": {},
+                "props": {},
+            }
+
+        hosts[server_name]["ipv4"] = record["ipv4"]
+        hosts[server_name]["services"][name] = {
+            "type": record["type"],
+            "port": record["port"],
+            "properties": record["properties"],
+        }
+        hosts[server_name]["props"].update(record["properties"])
+
+    return hosts
+
+
+async def browse_once(aiozc: AsyncZeroconf, timeout: float) -> dict[str, dict]:
+    """Browse for Dante services for up to ``timeout`` seconds and resolve them.
+
+    Used where no persistent browser is running (the config flow). Returns
+    the same per-device structure as group_records_by_host.
+    """
+    loop = asyncio.get_running_loop()
+    found_services: dict[str, str] = {}  # name -> service_type
+    last_add: float | None = None
+
+    def on_state_change(
+        zeroconf: object,
+        service_type: str,
+        name: str,
+        state_change: ServiceStateChange,
+    ) -> None:
+        nonlocal last_add
+        if state_change is ServiceStateChange.Added:
+            found_services[name] = service_type
+            last_add = loop.time()
+
+    browser = AsyncServiceBrowser(
+        aiozc.zeroconf,
+        _BROWSE_TYPES,
+        handlers=[on_state_change],
+    )
+    # Stop once answers have settled (no new service for MDNS_SETTLE_TIME),
+    # or after the full timeout if nothing answers at all
+    start = loop.time()
+    while (now := loop.time()) - start < timeout:
+        if last_add is not None and now - last_add >= MDNS_SETTLE_TIME:
+            break
+        await asyncio.sleep(0.2)
+    await browser.async_cancel()
+
+    LOGGER.debug("Dante: browse found %d services", len(found_services))
+
+    semaphore = asyncio.Semaphore(MDNS_RESOLVE_CONCURRENCY)
+
+    async def _bounded_resolve(name: str) -> dict[str, Any] | None:
+        async with semaphore:
+            return await async_resolve_service(aiozc, found_services[name], name)
+
+    names = list(found_services)
+    results = await asyncio.gather(
+        *(_bounded_resolve(n) for n in names),
+        return_exceptions=True,
+    )
+
+    records: dict[str, dict[str, Any]] = {}
+    for name, record in zip(names, results):
+        if isinstance(record, Exception):
+            LOGGER.debug("Error resolving %s: %s", name, record)
+        elif record is not None:
+            records[name] = record
+
+    return group_records_by_host(records)
+
+
+class _SapProtocol(asyncio.DatagramProtocol):
+    """Collect AES67 streams from SAP announcements into a shared dict."""
+
+    def __init__(self, streams: dict[str, Any]) -> None:
+        """Initialize the protocol."""
+        self._streams = streams
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Parse one SAP packet; malformed packets are ignored."""
+        try:
+            stream = DanteDataUpdateCoordinator._parse_sap_packet(data)
+        except Exception:
+            return
+        if stream:
+            self._streams[stream["session_name"]] = stream
+
+
+class DanteDataUpdateCoordinator(
+    DataUpdateCoordinator[DanteCoordinatorData]
+):
     """Coordinator to manage Dante device discovery and data.
 
     Architecture: mDNS is used ONLY for discovering new devices and updating
@@ -33,35 +319,160 @@ class DanteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     on busy networks.
     """
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=SCAN_INTERVAL),
+            # Snapshots are dataclasses, so an unchanged network compares equal
+            # and entities are not rewritten every poll
+            always_update=False,
+        )
+        # Refresh after entity setters; a burst of changes (e.g. a script
+        # routing many channels) shares a single refresh
+        self._setter_refresh = Debouncer(
+            hass,
+            LOGGER,
+            cooldown=SETTER_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self._async_setter_refresh,
         )
         self._devices: dict = {}
+        # Per-device TX channel name -> channel, built lazily for the live
+        # DanteDevice it was built from
+        self._tx_name_index: dict[str, tuple[DanteDevice, dict[str, Any]]] = {}
         self._aes67_streams: dict[str, Any] = {}
+        # "[AES67] Stream - Channel" option -> (stream_info, 1-based flow channel)
+        self._aes67_option_index: dict[str, tuple[dict[str, Any], int]] = {}
         # Local AES67 selections keyed by (device_name, rx_channel_num)
         self._aes67_selections: dict[tuple[str, int], str] = {}
         # Track consecutive failed direct-query cycles per device (keyed by server_name)
         self._miss_count: dict[str, int] = {}
+        # Caps devices queried at once (each query holds several UDP sockets)
+        self._query_semaphore = asyncio.Semaphore(DEVICE_QUERY_CONCURRENCY)
+        # Last SAP bind-IP probe: (device_ip, local_ip, monotonic time)
+        self._cached_bind_ip: tuple[str, str, float] | None = None
+        # AES67 subscribe sockets, one per device IP (used from executor jobs),
+        # each with a lock serializing its request/response pairs.
+        # _subscribe_lock only guards the two dicts.
+        self._subscribe_socks: dict[str, socket.socket] = {}
+        self._subscribe_ip_locks: dict[str, threading.Lock] = {}
+        self._subscribe_lock = threading.Lock()
         # Cache last-known coordinator result data (keyed by dev_name)
-        self._cached_data: dict[str, Any] = {}
+        self._cached_data: dict[str, DanteDeviceSnapshot] = {}
         # Registry of all known devices with connection info (keyed by server_name)
         # Each entry: {ipv4, services, props, dev_name}
         self._known_devices: dict[str, dict[str, Any]] = {}
         # Persistent mDNS browser state
+        self._aiozc: AsyncZeroconf | None = None
         self._browser: AsyncServiceBrowser | None = None
-        self._discovered_services: dict[str, str] = {}  # name -> service_type
+        # Resolved mDNS services, kept current by the browser (keyed by service name)
+        # Each entry: {type, server_name, ipv4, port, properties}
+        self._records: dict[str, dict[str, Any]] = {}
+        # Service names with a resolve task in flight
+        self._resolving: set[str] = set()
+        # Browsed service names whose last resolve failed -> service type;
+        # retried on every poll until they resolve or are removed
+        self._unresolved: dict[str, str] = {}
+        self._last_record_time = 0.0
+        # Caps concurrent resolves (startup fires one Added event per service)
+        self._resolve_semaphore = asyncio.Semaphore(MDNS_RESOLVE_CONCURRENCY)
         self._browser_ready = asyncio.Event()
-        # Per-platform known-devices tracking (survives coordinator refreshes)
-        self._platform_known_devices: dict[str, set[str]] = {}
-
-    def setdefault_known_devices(self, platform: str) -> None:
-        """Ensure a known-devices set exists for a platform."""
-        self._platform_known_devices.setdefault(platform, set())
+        # Sorted "DeviceName - ChannelName" options, rebuilt once per poll
+        self._tx_channel_options: tuple[str, ...] = ()
+        # Options shared by every subscription select, rebuilt only when the
+        # TX channels or AES67 sources change; options_version tracks rebuilds
+        self._subscription_options: list[str] = [SUBSCRIPTION_NONE]
+        self.options_version = 0
+        # Bumped when AES67 streams or restored selections change
+        self._aes67_version = 0
+        # Every device name ever stored in coordinator.data, in order of first
+        # appearance (append-only), and how far each platform has consumed it.
+        # Kept on the coordinator so it survives platform reloads.
+        self._seen_devices: set[str] = set()
+        self._seen_device_names: list[str] = []
+        self._platform_device_cursor: dict[str, int] = {}
+        # The coordinator.data object _seen_device_names was last synced from
+        self._seen_from_data: DanteCoordinatorData | None = None
+        self._signalled_device_count = 0
+        # Per entry, so platforms of another entry are not woken
+        self.new_devices_signal = SIGNAL_NEW_DEVICES.format(entry.entry_id)
+
+    @callback
+    def async_schedule_setter_refresh(self) -> None:
+        """Schedule a refresh after a device setting was changed."""
+        self._setter_refresh.async_schedule_call()
+
+    async def _async_setter_refresh(self) -> None:
+        """Refresh after a setter, notifying listeners even if nothing changed.
+
+        A setter that silently failed on the device leaves the data unchanged,
+        so always_update=False would skip the listeners and entities would
+        keep showing their optimistic state.
+        """
+        # Hold the lock the scheduled poll and request debouncer run under,
+        # so a setter refresh never overlaps another poll
+        async with self._debounced_refresh.async_lock():
+            previous_data = self.data
+            previous_success = self.last_update_success
+            await self.async_refresh()
+            if (
+                self.last_update_success == previous_success
+                and self.data == previous_data
+            ):
+                self.async_update_listeners()
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending refreshes."""
+        self._setter_refresh.async_shutdown()
+        await super().async_shutdown()
+
+    @callback
+    def async_track_new_devices(self) -> CALLBACK_TYPE:
+        """Start signalling new devices; call once the platforms are set up.
+
+        The platforms took every device known so far during setup, so only
+        devices seen after this point trigger the signal.
+        """
+        self._record_new_devices()
+        self._signalled_device_count = len(self._seen_device_names)
+        return self.async_add_listener(self.async_signal_new_devices)
+
+    @callback
+    def async_signal_new_devices(self) -> None:
+        """Notify the platforms once when the last update saw new devices."""
+        self._record_new_devices()
+        count = len(self._seen_device_names)
+        if count != self._signalled_device_count:
+            self._signalled_device_count = count
+            async_dispatcher_send(self.hass, self.new_devices_signal)
+
+    def _record_new_devices(self) -> None:
+        """Append devices first seen in the stored coordinator data.
+
+        Reads self.data rather than the update in progress, so a device is
+        only handed out once its snapshot has actually been committed.
+        """
+        data = self.data
+        if data is None or data is self._seen_from_data:
+            return
+        self._seen_from_data = data
+        for dev_name in data.devices:
+            if dev_name not in self._seen_devices:
+                self._seen_devices.add(dev_name)
+                self._seen_device_names.append(dev_name)
+
+    def take_new_devices(self, platform: str) -> list[str]:
+        """Return devices first seen since the platform last asked."""
+        self._record_new_devices()
+        start = self._platform_device_cursor.get(platform, 0)
+        end = len(self._seen_device_names)
+        if start == end:
+            return []
+        self._platform_device_cursor[platform] = end
+        return self._seen_device_names[start:end]
 
     def _on_service_state_change(
         self,
@@ -71,27 +482,74 @@ class DanteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         **kwargs,
     ) -> None:
         """Handle mDNS service state changes from the persistent browser."""
-        if state_change is ServiceStateChange.Added:
-            self._discovered_services[name] = service_type
-        elif state_change is ServiceStateChange.Removed:
-            self._discovered_services.pop(name, None)
+        if state_change is ServiceStateChange.Removed:
+            self._records.pop(name, None)
+            self._unresolved.pop(name, None)
+            return
+        # Added / Updated: (re)resolve in the background so polls only read the cache
+        self._async_schedule_resolve(service_type, name)
+
+    @callback
+    def _async_schedule_resolve(self, service_type: str, name: str) -> None:
+        """Start a background resolve of a service unless one is in flight."""
+        if name in self._resolving:
+            return
+        self._resolving.add(name)
+        self.hass.async_create_background_task(
+            self._async_resolve_service(service_type, name),
+            f"{DOMAIN} resolve {name}",
+        )
+
+    async def _async_resolve_service(self, service_type: str, name: str) -> None:
+        """Resolve a single mDNS service and store it in the record cache."""
+        # First sighting: ask for unicast (QU) responses so the answer does
+        # not go to every host on the segment
+        previous = self._records.get(name)
+        question_type = None if previous is not None else DNSQuestionType.QU
+        try:
+            async with self._resolve_semaphore:
+                record = await async_resolve_service(
+                    self._aiozc, service_type, name, question_type, previous
+                )
+        except Exception as err:
+            LOGGER.debug("Error resolving %s (%s): %s", name, service_type, err)
+            record = None
+        finally:
+            self._resolving.discard(name)
+
+        if record is None:
+            self._unresolved[name] = service_type
+            return
+        self._unresolved.pop(name, None)
+        self._records[name] = record
+        self._last_record_time = asyncio.get_running_loop().time()
 
     async def async_start_browser(self) -> None:
         """Start the persistent mDNS browser."""
         if self._browser is not None:
             return
-        aiozc = await zeroconf.async_get_async_instance(self.hass)
+        self._aiozc = await zeroconf.async_get_async_instance(self.hass)
         self._browser = AsyncServiceBrowser(
-            aiozc.zeroconf,
-            SERVICES,
+            self._aiozc.zeroconf,
+            _BROWSE_TYPES,
             handlers=[self._on_service_state_change],
         )
-        # Give devices time to respond on initial startup
-        await asyncio.sleep(MDNS_TIMEOUT * 3)
+        # Give devices time to respond on initial startup: wait until resolved
+        # records stop arriving, bounded by MDNS_TIMEOUT * 3 if none do
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        while (now := loop.time()) - start < MDNS_TIMEOUT * 3:
+            if (
+                self._records
+                and not self._resolving
+                and now - self._last_record_time >= MDNS_SETTLE_TIME
+            ):
+                break
+            await asyncio.sleep(0.2)
         self._browser_ready.set()
         LOGGER.info(
-            "Persistent mDNS browser started, %d services found initially",
-            len(self._discovered_services),
+            "Persistent mDNS browser started, %d services resolved initially",
+            len(self._records),
         )
 
     async def async_stop_browser(self) -> None:
@@ -100,131 +558,168 @@ class DanteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             await self._browser.async_cancel()
             self._browser = None
 
+    def close_subscribe_sockets(self) -> None:
+        """Close the pooled AES67 subscribe sockets."""
+        with self._subscribe_lock:
+            for sock in self._subscribe_socks.values():
+                sock.close()
+            self._subscribe_socks.clear()
+
     def _build_device_data(
-        self, device: DanteDevice, server_name: str
-    ) -> dict[str, Any]:
-        """Build the coordinator result dict for a single device."""
-        dev_name = device.name or server_name
-        dev_data: dict[str, Any] = {
-            "server_name": server_name,
-            "name": dev_name,
-            "ipv4": str(device.ipv4) if device.ipv4 else None,
-            "mac_address": getattr(device, "mac_address", None),
-            "manufacturer": getattr(device, "manufacturer", None),
-            "model": getattr(device, "model", None),
-            "model_id": getattr(device, "model_id", None),
-            "software": getattr(device, "software", None),
-            "sample_rate": getattr(device, "sample_rate", None),
-            "latency": getattr(device, "latency", None),
-            "rx_count": getattr(device, "rx_count", 0) or 0,
-            "tx_count": getattr(device, "tx_count", 0) or 0,
-            "rx_channels": {},
-            "tx_channels": {},
-            "subscriptions": [],
+        self,
+        device: DanteDevice,
+        server_name: str,
+        previous: DanteDeviceSnapshot | None = None,
+    ) -> DanteDeviceSnapshot:
+        """Build the coordinator snapshot for a single device.
+
+        Channel and subscription collections are taken over from ``previous``
+        (the device's last snapshot) when their content has not changed.
+        """
+        subscriptions = self._subscriptions_snapshot(
+            device.subscriptions, previous.subscriptions if previous else None
+        )
+        if previous is not None and subscriptions is previous.subscriptions:
+            subscriptions_by_rx = previous.subscriptions_by_rx
+        else:
+            subscriptions_by_rx = {}
+            for sub in subscriptions:
+                if sub["tx_device_name"] and sub["tx_channel_name"]:
+                    subscriptions_by_rx.setdefault(sub["rx_channel_name"], sub)
+        return DanteDeviceSnapshot(
+            server_name=server_name,
+            name=device.name or server_name,
+            ipv4=device.ipv4_str,
+            mac_address=device.mac_address,
+            manufacturer=device.manufacturer,
+            model=device.model,
+            model_id=device.model_id,
+            software=device.software,
+            sample_rate=device.sample_rate,
+            latency=device.latency,
+            rx_count=device.rx_count or 0,
+            tx_count=device.tx_count or 0,
+            rx_channels=self._channels_snapshot(
+                device.rx_channels, previous.rx_channels if previous else None
+            ),
+            tx_channels=self._channels_snapshot(
+                device.tx_channels, previous.tx_channels if previous else None
+            ),
+            subscriptions=subscriptions,
+            subscriptions_by_rx=subscriptions_by_rx,
+        )
+
+    @staticmethod
+    def _channels_snapshot(
+        channels: dict[int, Any], previous: dict[int, dict[str, Any]] | None
+    ) -> dict[int, dict[str, Any]]:
+        """Serialize a channel dict, reusing ``previous`` if names are unchanged."""
+        if (
+            previous is not None
+            and len(previous) == len(channels)
+            and all(
+                (prev := previous.get(num)) is not None and prev["name"] == ch.name
+                for num, ch in channels.items()
+            )
+        ):
+            return previous
+        return {
+            num: {"name": ch.name, "number": ch.number}
+            for num, ch in channels.items()
         }
 
-        if device.rx_channels:
-            for num, ch in device.rx_channels.items():
-                dev_data["rx_channels"][num] = {
-                    "name": ch.name,
-                    "number": ch.number,
-                }
-
-        if device.tx_channels:
-            for num, ch in device.tx_channels.items():
-                dev_data["tx_channels"][num] = {
-                    "name": ch.name,
-                    "number": ch.number,
-                }
-
-        if device.subscriptions:
-            for sub in device.subscriptions:
-                dev_data["subscriptions"].append(
-                    {
-                        "rx_channel_name": getattr(
-                            sub, "rx_channel_name", None
-                        ),
-                        "tx_channel_name": getattr(
-                            sub, "tx_channel_name", None
-                        ),
-                        "tx_device_name": getattr(
-                            sub, "tx_device_name", None
-                        ),
-                        "status_code": getattr(sub, "status_code", None),
-                    }
-                )
+    @staticmethod
+    def _subscriptions_snapshot(
+        subscriptions: list[Any], previous: list[dict[str, Any]] | None
+    ) -> list[dict[str, Any]]:
+        """Serialize subscriptions, reusing ``previous`` if nothing changed."""
+        if (
+            previous is not None
+            and len(previous) == len(subscriptions)
+            and all(
+                prev["rx_channel_name"] == sub.rx_channel_name
+                and prev["tx_channel_name"] == sub.tx_channel_name
+                and prev["tx_device_name"] == sub.tx_device_name
+                and prev["status_code"] == sub.status_code
+                for prev, sub in zip(previous, subscriptions)
+            )
+        ):
+            return previous
+        return [
+            {
+                "rx_channel_name": sub.rx_channel_name,
+                "tx_channel_name": sub.tx_channel_name,
+                "tx_device_name": sub.tx_device_name,
+                "status_code": sub.status_code,
+            }
+            for sub in subscriptions
+        ]
 
-        return dev_data
+    @staticmethod
+    def _build_device(server_name: str, known_info: dict[str, Any]) -> DanteDevice:
+        """Create a DanteDevice from a known-devices registry entry."""
+        device = DanteDevice(server_name=server_name)
+        device.ipv4 = known_info["ipv4"]
+
+        # Attach cached mDNS services so device opens proper sockets
+        for svc_name, svc_data in known_info.get("services", {}).items():
+            device.services[svc_name] = svc_data
+
+        # Apply cached mDNS properties
+        props = known_info.get("props", {})
+        for key, attr, cast in _PROP_SETTERS:
+            value = props.get(key)
+            if value is None:
+                continue
+            try:
+                setattr(device, attr, cast(value))
+            except (ValueError, TypeError):
+                pass
+        if props.get("router_info") == '"Dante Via"':
+            device.software = "Dante Via"
 
-    def _resolve_server_name(self, info: AsyncServiceInfo, fallback_name: str) -> str:
-        """Extract the Dante device name from the mDNS service name.
+        return device
 
-        Always uses the service name prefix (the Dante device name set in
-        Dante Controller) rather than info.server (hardware hostname).
-        Dante device names are guaranteed unique on the network and are
-        what users expect to see. Hardware hostnames can be generic or
-        short (e.g. "2") which caused device merges in the HA registry.
-        """
-        return fallback_name.split(".")[0]
+    async def _async_query_device(self, device: DanteDevice) -> bool:
+        """Query a device directly by unicast UDP; return False on failure."""
+        try:
+            async with self._query_semaphore:
+                await device.get_controls()
+        except Exception as err:
+            LOGGER.debug(
+                "Direct query failed for %s (%s): %s",
+                device.server_name, device.ipv4, err,
+            )
+            return False
+        return True
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_update_data(self) -> DanteCoordinatorData:
         """Fetch data from the Dante network.
 
         Three-phase approach:
-        1. Resolve mDNS services to discover NEW devices and update IPs
+        1. Read mDNS services resolved by the persistent browser (new devices,
+           IP updates) -- no network I/O happens here
         2. Merge mDNS results into the known-devices registry
         3. Query ALL known devices directly by IP (unicast UDP)
 
         This ensures known devices are never lost due to mDNS unreliability.
         A device is only removed after DEVICE_MISS_LIMIT consecutive direct
         query failures.
+
+        SAP discovery only needs the local interface address, so it runs
+        alongside the device queries rather than after them.
         """
+        sap_task: asyncio.Task[dict[str, Any]] | None = None
         try:
             # Wait for browser to be ready (only blocks on first poll)
             await asyncio.wait_for(self._browser_ready.wait(), timeout=MDNS_TIMEOUT * 4)
 
-            aiozc = await zeroconf.async_get_async_instance(self.hass)
-
-            # --- PHASE 1: Resolve mDNS for new devices / IP updates ---
-            found_services = list(self._discovered_services.items())
-            mdns_hosts: dict[str, dict] = {}
-
-            for name, service_type in found_services:
-                try:
-                    info = AsyncServiceInfo(service_type, name)
-                    if not await info.async_request(aiozc.zeroconf, 3000):
-                        continue
-
-                    addresses = info.parsed_addresses()
-                    if not addresses:
-                        continue
-
-                    ipv4 = addresses[0]
-                    props = {}
-                    for k, v in info.properties.items():
-                        k = k.decode("utf-8") if isinstance(k, bytes) else k
-                        v = v.decode("utf-8") if isinstance(v, bytes) else v
-                        props[k] = v
-
-                    server_name = self._resolve_server_name(info, name)
-
-                    if server_name not in mdns_hosts:
-                        mdns_hosts[server_name] = {
-                            "ipv4": ipv4,
-                            "services": {},
-                            "props": {},
-                        }
-
-                    mdns_hosts[server_name]["ipv4"] = ipv4
-                    mdns_hosts[server_name]["services"][name] = {
-                        "type": service_type,
-                        "port": info.port,
-                        "properties": props,
-                    }
-                    mdns_hosts[server_name]["props"].update(props)
+            # Retry services whose resolve failed; results land in a later poll
+            for name, service_type in list(self._unresolved.items()):
+                self._async_schedule_resolve(service_type, name)
 
-                except Exception as err:
-                    LOGGER.debug("Error resolving %s: %s", name, err)
+            # --- PHASE 1: Group browser-resolved mDNS records by device ---
+            mdns_hosts = group_records_by_host(self._records)
 
             # --- PHASE 2: Merge mDNS into known-devices registry ---
             for server_name, mdns_info in mdns_hosts.items():
@@ -257,51 +752,33 @@ class DanteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
 
             # --- PHASE 3: Query ALL known devices by direct unicast ---
-            result: dict[str, Any] = {}
-
-            for server_name, known_info in list(self._known_devices.items()):
-                device = DanteDevice(server_name=server_name)
-                device.ipv4 = known_info["ipv4"]
-
-                # Attach cached mDNS services so device opens proper sockets
-                for svc_name, svc_data in known_info.get("services", {}).items():
-                    device.services[svc_name] = svc_data
-
-                # Apply cached mDNS properties
-                props = known_info.get("props", {})
-                if "id" in props:
-                    device.mac_address = props["id"]
-                if "model" in props:
-                    device.model_id = props["model"]
-                if "rate" in props:
-                    try:
-                        device.sample_rate = int(props["rate"])
-                    except (ValueError, TypeError):
-                        pass
-                if "latency_ns" in props:
-                    try:
-                        device.latency = int(props["latency_ns"])
-                    except (ValueError, TypeError):
-                        pass
-                if (
-                    "router_info" in props
-                    and props["router_info"] == '"Dante Via"'
-                ):
-                    device.software = "Dante Via"
-
-                # Direct unicast query
-                query_ok = False
-                try:
-                    await self.hass.async_add_executor_job(
-                        lambda d=device: asyncio.run(d.get_controls())
-                    )
-                    query_ok = True
-                except Exception as err:
-                    LOGGER.debug(
-                        "Direct query failed for %s (%s): %s",
-                        server_name, known_info["ipv4"], err,
-                    )
+            result: dict[str, DanteDeviceSnapshot] = {}
 
+            # Start AES67/SAP discovery now; it listens for SAP_TIMEOUT while
+            # the device queries below run
+            bind_ip = self._find_bind_ip(
+                info.get("ipv4") for info in self._known_devices.values()
+            )
+            LOGGER.debug(
+                "SAP: bind_ip=%s from %d devices", bind_ip, len(self._known_devices)
+            )
+            if bind_ip:
+                sap_task = self.hass.async_create_task(
+                    self._async_discover_sap_streams(bind_ip)
+                )
+
+            known = list(self._known_devices.items())
+            devices = [
+                self._build_device(server_name, known_info)
+                for server_name, known_info in known
+            ]
+            query_results = await asyncio.gather(
+                *(self._async_query_device(device) for device in devices)
+            )
+
+            for (server_name, known_info), device, query_ok in zip(
+                known, devices, query_results
+            ):
                 # Check if we got meaningful data back
                 has_data = query_ok and (
                     device.name or device.rx_channels or device.tx_channels
@@ -314,7 +791,9 @@ class DanteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     # Cache the resolved dev_name so failed queries reuse it
                     if device.name:
                         known_info["dev_name"] = device.name
-                    dev_data = self._build_device_data(device, server_name)
+                    dev_data = self._build_device_data(
+                        device, server_name, self._cached_data.get(dev_name)
+                    )
                     result[dev_name] = dev_data
                     self._devices[dev_name] = device
                 else:
@@ -339,22 +818,38 @@ class DanteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         self._known_devices.pop(server_name, None)
                         self._cached_data.pop(dev_name, None)
                         self._devices.pop(dev_name, None)
+                        self._tx_name_index.pop(dev_name, None)
 
             # Update cache with current results
             self._cached_data.update(result)
+            tx_channel_options = tuple(
+                sorted(
+                    f"{dev_name} - {ch_data['name']}"
+                    for dev_name, dev_data in result.items()
+                    for ch_data in dev_data.tx_channels.values()
+                )
+            )
+            if tx_channel_options != self._tx_channel_options:
+                self._tx_channel_options = tx_channel_options
+                self._rebuild_subscription_options()
 
-            # Discover AES67/SAP streams
-            bind_ip = self._find_bind_ip(result)
-            LOGGER.debug("SAP: bind_ip=%s from %d devices", bind_ip, len(result))
-            if bind_ip:
+            # AES67 state lives outside the snapshots; changes to it bump the
+            # version carried in the returned data
+            aes67_changed = False
+
+            # Collect AES67/SAP streams
+            if sap_task is not None:
                 try:
-                    new_streams = await self.hass.async_add_executor_job(
-                        self._discover_sap_streams, bind_ip
-                    )
+                    new_streams = await sap_task
                     # Merge new discoveries into cache (SAP announcements are
                     # periodic so we won't see all streams every poll cycle)
-                    if new_streams:
+                    if any(
+                        self._aes67_streams.get(name) != info
+                        for name, info in new_streams.items()
+                    ):
                         self._aes67_streams.update(new_streams)
+                        self._rebuild_aes67_option_index()
+                        aes67_changed = True
                     LOGGER.debug(
                         "SAP: found %d new, %d total AES67 streams",
                         len(new_streams),
@@ -366,44 +861,82 @@ class DanteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 LOGGER.debug("No Dante device IPs found, skipping SAP discovery")
 
             # Reconcile AES67 subscriptions from device state + SAP streams
-            if self._aes67_streams:
-                self._reconcile_aes67_subscriptions(result)
+            if self._aes67_streams and self._reconcile_aes67_subscriptions(result):
+                aes67_changed = True
+
+            if aes67_changed:
+                self._aes67_version += 1
 
-            return result
+            return DanteCoordinatorData(result, self._aes67_version)
 
         except Exception as err:
             raise UpdateFailed(
                 f"Error communicating with Dante network: {err}"
             ) from err
+        finally:
+            if sap_task is not None:
+                # Also retrieves a result or error the task already stored,
+                # so a failed poll does not leave it unretrieved
+                sap_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await sap_task
 
     def get_device(self, device_name: str):
         """Get a live DanteDevice object by name."""
         return self._devices.get(device_name)
 
-    def get_all_tx_channels(self) -> list[str]:
-        """Get all TX channels across all devices as 'DeviceName - ChannelName'."""
-        options = []
-        if self.data:
-            for dev_name, dev_data in self.data.items():
-                for _num, ch_data in dev_data.get("tx_channels", {}).items():
-                    options.append(f"{dev_name} - {ch_data['name']}")
-        return sorted(options)
-
-    def get_all_aes67_sources(self) -> list[str]:
-        """Get all AES67 streams as individual channel options."""
-        options = []
+    def get_tx_channel(self, device_name: str, channel_name: str):
+        """Get a live TX channel object of a device by channel name."""
+        device = self._devices.get(device_name)
+        if device is None:
+            return None
+        entry = self._tx_name_index.get(device_name)
+        if entry is None or entry[0] is not device:
+            by_name: dict[str, Any] = {}
+            for ch in (device.tx_channels or {}).values():
+                by_name.setdefault(ch.name, ch)
+            entry = self._tx_name_index[device_name] = (device, by_name)
+        return entry[1].get(channel_name)
+
+    def _rebuild_aes67_option_index(self) -> None:
+        """Index every AES67 stream channel by its select option string."""
+        index: dict[str, tuple[dict[str, Any], int]] = {}
         for name, info in sorted(self._aes67_streams.items()):
-            ch_names = self._get_channel_names(info)
-            for ch_name in ch_names:
-                options.append(f"[AES67] {name} - {ch_name}")
-        return options
+            for idx, ch_name in enumerate(self._get_channel_names(info), 1):
+                # First channel wins on duplicate names
+                index.setdefault(f"[AES67] {name} - {ch_name}", (info, idx))
+        self._aes67_option_index = index
+        self._rebuild_subscription_options()
+
+    def _rebuild_subscription_options(self) -> None:
+        """Rebuild the shared subscription select options."""
+        self._subscription_options = [
+            SUBSCRIPTION_NONE,
+            *self._tx_channel_options,
+            *self._aes67_option_index,
+        ]
+        self.options_version += 1
+
+    def get_subscription_options(self) -> list[str]:
+        """Get the subscription select options: none, Dante TX channels, AES67.
+
+        The list is shared by every subscription select; do not mutate it.
+        """
+        return self._subscription_options
 
     @staticmethod
     def _get_channel_names(info: dict[str, Any]) -> list[str]:
-        """Extract individual channel names from stream info."""
-        ch_count = info.get("channels", 1)
-        channel_info = info.get("channel_info", "")
+        """Return the individual channel names of a stream."""
+        names = info.get("channel_names")
+        if names is not None:
+            return names
+        return DanteDataUpdateCoordinator._compute_channel_names(
+            info.get("channels", 1), info.get("channel_info", "")
+        )
 
+    @staticmethod
+    def _compute_channel_names(ch_count: int, channel_info: str | None) -> list[str]:
+        """Extract individual channel names from the SDP channel count and i= line."""
         # Try to parse from i= line, e.g. "2 channels: Tx Left, Tx Right"
         if channel_info and ":" in channel_info:
             _, _, names_part = channel_info.partition(":")
@@ -418,30 +951,46 @@ class DanteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return ["Left", "Right"]
         return [f"Ch{i+1}" for i in range(ch_count)]
 
-    @staticmethod
-    def _find_bind_ip(result: dict[str, Any]) -> str | None:
-        """Determine the local IP on the same subnet as discovered Dante devices."""
-        for dev_data in result.values():
-            if not isinstance(dev_data, dict):
-                continue
-            ipv4 = dev_data.get("ipv4")
-            if not ipv4:
-                continue
+    def _find_bind_ip(self, device_ips: Iterable[str | None]) -> str | None:
+        """Determine the local IP on the same subnet as discovered Dante devices.
+
+        The routing probe result is reused for _BIND_IP_CACHE_TTL seconds as
+        long as the device it was probed against is still known.
+        """
+        ips = [ip for ip in device_ips if ip]
+        now = time.monotonic()
+        if self._cached_bind_ip is not None:
+            probe_ip, local_ip, probed_at = self._cached_bind_ip
+            if probe_ip in ips and now - probed_at < _BIND_IP_CACHE_TTL:
+                return local_ip
+
+        for ipv4 in ips:
             try:
                 s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
                 s.connect((ipv4, 1))
                 local_ip = s.getsockname()[0]
                 s.close()
-                return local_ip
             except Exception:
                 continue
+            self._cached_bind_ip = (ipv4, local_ip, now)
+            return local_ip
+        self._cached_bind_ip = None
         return None
 
-    def _discover_sap_streams(self, bind_ip: str) -> dict[str, Any]:
-        """Discover AES67 streams via SAP multicast (blocking I/O)."""
+    async def _async_discover_sap_streams(self, bind_ip: str) -> dict[str, Any]:
+        """Discover AES67 streams via SAP multicast for SAP_TIMEOUT seconds."""
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            # Room for a burst of announcements arriving while the loop is busy
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SAP_RCVBUF)
+            if sys.platform.startswith("linux"):
+                # Only deliver groups joined on this socket, not every group
+                # the host is a member of on SAP_PORT (Linux >= 2.6.31)
+                try:
+                    sock.setsockopt(socket.IPPROTO_IP, _IP_MULTICAST_ALL, 0)
+                except OSError as err:
+                    LOGGER.debug("SAP: IP_MULTICAST_ALL not supported: %s", err)
             sock.bind(("", SAP_PORT))
 
             # Join SAP multicast group on the Dante network interface
@@ -451,28 +1000,24 @@ class DanteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 socket.inet_aton(bind_ip),
             )
             sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+        except Exception:
+            sock.close()
+            raise
 
-            streams: dict[str, Any] = {}
-            deadline = time.monotonic() + SAP_TIMEOUT
-
-            while True:
-                remaining = deadline - time.monotonic()
-                if remaining <= 0:
-                    break
-                ready, _, _ = sel.select([sock], [], [], min(remaining, 1.0))
-                if not ready:
-                    continue
-                try:
-                    data, _addr = sock.recvfrom(4096)
-                    stream = self._parse_sap_packet(data)
-                    if stream:
-                        streams[stream["session_name"]] = stream
-                except Exception:
-                    pass
-
-            return streams
-        finally:
+        streams: dict[str, Any] = {}
+        try:
+            transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+                lambda: _SapProtocol(streams), sock=sock
+            )
+        except BaseException:
+            # The transport owns the socket only once it has been created
             sock.close()
+            raise
+        try:
+            await asyncio.sleep(SAP_TIMEOUT)
+        finally:
+            transport.close()
+        return streams
 
     @staticmethod
     def _parse_sap_packet(data: bytes) -> dict[str, Any] | None:
@@ -480,34 +1025,25 @@ class DanteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if len(data) < 8:
             return None
 
-        header = data[0]
-        version = (header >> 5) & 0x07
-        addr_type = (header >> 4) & 0x01
-        msg_type = (header >> 2) & 0x01  # 0=announcement, 1=deletion
-
-        if version != 1 or msg_type != 0:
+        header, auth_len = _SAP_HEADER.unpack_from(data)
+        # Version 1 (bits 7-5) and announcement, not deletion (bit 2)
+        if header & 0xE4 != 0x20:
             return None
 
-        auth_len = data[1]  # in 32-bit words
-        origin_len = 4 if addr_type == 0 else 16
-        payload_start = 4 + origin_len + (auth_len * 4)
+        origin_len = 16 if header & 0x10 else 4  # IPv6 vs IPv4 origin
+        payload_start = 4 + origin_len + (auth_len * 4)  # auth_len in 32-bit words
 
         if payload_start >= len(data):
             return None
 
-        payload = data[payload_start:]
-
         # Skip optional MIME type (null-terminated string before SDP)
-        if not payload.startswith(b"v="):
-            null_idx = payload.find(b"\0")
+        if not data.startswith(b"v=", payload_start):
+            null_idx = data.find(b"\0", payload_start)
             if null_idx == -1:
                 return None
-            payload = payload[null_idx + 1:]
+            payload_start = null_idx + 1
 
-        try:
-            sdp_text = payload.decode("utf-8", errors="replace")
-        except Exception:
-            return None
+        sdp_text = str(memoryview(data)[payload_start:], "utf-8", "replace")
 
         return DanteDataUpdateCoordinator._parse_sdp(sdp_text)
 
@@ -519,57 +1055,55 @@ class DanteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     @staticmethod
     def _parse_sdp(sdp: str) -> dict[str, Any] | None:
         """Parse SDP text and extract AES67 stream info."""
-        session_name = None
+        matches = _SDP_FIELD_RE.findall(sdp)
+        # Last occurrence of each field wins, as with a line-by-line scan
+        fields = {key or "a": value for key, value in matches}
+        session_name = fields.get("s")
+        if not session_name:
+            return None
+
         session_id = None
         origin_ip = None
         multicast_addr = None
         port = None
-        codec = None
+        codec = fields.get("a")
         channels = 1
-        channel_info = None
-
-        for line in sdp.strip().splitlines():
-            line = line.strip()
-            if line.startswith("s="):
-                session_name = line[2:]
-            elif line.startswith("o="):
-                # o=nax 821074694 127 IN IP4 10.11.7.71
-                parts = line[2:].split()
-                if len(parts) >= 6:
-                    origin_ip = parts[5]
-                    try:
-                        session_id = int(parts[1])
-                    except ValueError:
-                        pass
-            elif line.startswith("c="):
-                # c=IN IP4 239.69.85.220/32
-                parts = line[2:].split()
-                if len(parts) >= 3:
-                    multicast_addr = parts[2].split("/")[0]
-            elif line.startswith("m="):
-                # m=audio 5004 RTP/AVP 97
-                parts = line[2:].split()
-                if len(parts) >= 2:
+        channel_info = fields.get("i")
+
+        if (origin := fields.get("o")) is not None:
+            # o=nax 821074694 127 IN IP4 10.11.7.71
+            parts = origin.split()
+            if len(parts) >= 6:
+                origin_ip = parts[5]
+                try:
+                    session_id = int(parts[1])
+                except ValueError:
+                    pass
+        if (connection := fields.get("c")) is not None:
+            # c=IN IP4 239.69.85.220/32
+            parts = connection.split()
+            if len(parts) >= 3:
+                multicast_addr = parts[2].split("/")[0]
+        if (media := fields.get("m")) is not None:
+            # m=audio 5004 RTP/AVP 97
+            parts = media.split()
+            if len(parts) >= 2:
+                try:
+                    port = int(parts[1])
+                except ValueError:
+                    pass
+        if codec is not None:
+            # a=rtpmap:97 L24/48000/2 -- the channel count comes from the
+            # last rtpmap line that has one, not simply the last line
+            for key, value in matches:
+                if key:
+                    continue
+                codec_parts = value.split("/")
+                if len(codec_parts) >= 3:
                     try:
-                        port = int(parts[1])
+                        channels = int(codec_parts[2])
                     except ValueError:
                         pass
-            elif line.startswith("a=rtpmap:"):
-                # a=rtpmap:97 L24/48000/2
-                parts = line.split(" ", 1)
-                if len(parts) == 2:
-                    codec = parts[1]
-                    codec_parts = codec.split("/")
-                    if len(codec_parts) >= 3:
-                        try:
-                            channels = int(codec_parts[2])
-                        except ValueError:
-                            pass
-            elif line.startswith("i="):
-                channel_info = line[2:]
-
-        if not session_name:
-            return None
 
         return {
             "session_name": session_name,
@@ -580,6 +1114,13 @@ class DanteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "codec": codec,
             "channels": channels,
             "channel_info": channel_info,
+            # Parsed once here; read by every options render and lookup
+            "channel_names": DanteDataUpdateCoordinator._compute_channel_names(
+                channels, channel_info
+            ),
+            # Packed addresses for the AES67 subscribe command
+            "origin_ip_raw": _inet_aton_or_none(origin_ip),
+            "multicast_addr_raw": _inet_aton_or_none(multicast_addr),
         }
 
     @staticmethod
@@ -588,13 +1129,17 @@ class DanteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         flow_channel: int,
         stream_info: dict[str, Any],
         seq: int,
-    ) -> bytes:
+    ) -> bytearray:
         """Build a 112-byte AES67 subscription command (0x3201).
 
         Protocol reverse-engineered from Dante Controller captures.
         """
-        source_ip = socket.inet_aton(stream_info["origin_ip"])
-        mcast_ip = socket.inet_aton(stream_info["multicast_addr"])
+        source_ip = stream_info.get("origin_ip_raw") or socket.inet_aton(
+            stream_info["origin_ip"]
+        )
+        mcast_ip = stream_info.get("multicast_addr_raw") or socket.inet_aton(
+            stream_info["multicast_addr"]
+        )
         flow_id = stream_info["session_id"] & 0xFFFFFFFF
         rtp_port = stream_info["port"]
         ch_count = stream_info["channels"]
@@ -604,40 +1149,15 @@ class DanteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         enc_name = codec.split("/")[0] if codec else "L24"
         enc_byte = DanteDataUpdateCoordinator._AES67_ENCODING_MAP.get(enc_name, 0x08)
 
-        pkt = bytearray(112)
-
-        # Header
-        struct.pack_into(">2sHH2s", pkt, 0, b"\x28\x09", 112, seq, b"\x32\x01")
-        # Flags/version
-        pkt[10] = 0x01; pkt[11] = 0x01
-        pkt[12] = 0x00; pkt[13] = 0x10
-        # Record type
-        struct.pack_into(">H", pkt, 18, 0x4202)
-        # Record count
-        struct.pack_into(">H", pkt, 28, 0x0001)
-        # Offset
-        struct.pack_into(">H", pkt, 34, 0x0068)
-        # Sub-record structure
-        struct.pack_into(">H", pkt, 44, 0x0003)
-        struct.pack_into(">H", pkt, 46, 0x0040)
-        struct.pack_into(">H", pkt, 52, 0x0002)
-        struct.pack_into(">H", pkt, 54, 0x0060)
-
-        # Flow source info (offset 64)
-        struct.pack_into(">HH", pkt, 64, 0x1000, 0x000B)
-        pkt[68:72] = source_ip
-        struct.pack_into(">I", pkt, 76, flow_id)
-
-        # Channel mapping (offset 96)
-        struct.pack_into(">H", pkt, 96, rx_channel)
-        struct.pack_into(">H", pkt, 98, ch_count)
-        pkt[102] = flow_channel
-        pkt[104] = enc_byte
-        pkt[105] = ch_count
-        struct.pack_into(">H", pkt, 106, rtp_port)
-        pkt[108:112] = mcast_ip
-
-        return bytes(pkt)
+        pkt = bytearray(_AES67_TEMPLATE)
+        _AES67_SEQ.pack_into(pkt, 4, seq)
+        _AES67_FLOW_SOURCE.pack_into(pkt, 68, source_ip, flow_id)
+        _AES67_CHANNEL_MAP.pack_into(
+            pkt, 96, rx_channel, ch_count, flow_channel,
+            enc_byte, ch_count, rtp_port, mcast_ip,
+        )
+
+        return pkt
 
     def _send_aes67_subscribe(
         self,
@@ -654,14 +1174,42 @@ class DanteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             rx_channel, flow_channel, stream_info, seq
         )
 
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.settimeout(2.0)
-        try:
-            sock.sendto(pkt, (device_ip, self._AES67_COMMAND_PORT))
-            resp, _ = sock.recvfrom(2048)
-            # Check response: magic 0x2801, status at byte 8-9 == 0x0001 = success
-            if len(resp) >= 10 and resp[0] == 0x28 and resp[1] == 0x01:
-                status = struct.unpack_from(">H", resp, 8)[0]
+        with self._subscribe_lock:
+            ip_lock = self._subscribe_ip_locks.get(device_ip)
+            if ip_lock is None:
+                ip_lock = self._subscribe_ip_locks[device_ip] = threading.Lock()
+
+        # The per-device lock serializes request/response pairs so replies on
+        # the shared socket cannot be picked up by another caller, without an
+        # unreachable device stalling subscribes to the others.
+        with ip_lock:
+            with self._subscribe_lock:
+                sock = self._subscribe_socks.get(device_ip)
+                if sock is None:
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                    sock.settimeout(2.0)
+                    self._subscribe_socks[device_ip] = sock
+            try:
+                sock.sendto(pkt, (device_ip, self._AES67_COMMAND_PORT))
+                resp, _ = sock.recvfrom(2048)
+            except OSError as err:
+                # Drop the socket so a late reply is not read by the next call
+                with self._subscribe_lock:
+                    if self._subscribe_socks.get(device_ip) is sock:
+                        del self._subscribe_socks[device_ip]
+                sock.close()
+                if isinstance(err, socket.timeout):
+                    LOGGER.warning("AES67 subscribe timeout from %s", device_ip)
+                else:
+                    LOGGER.warning(
+                        "AES67 subscribe to %s failed: %s", device_ip, err
+                    )
+                return False
+
+        # Check response: magic 0x2801, status at byte 8-9 == 0x0001 = success
+        if len(resp) >= _AES67_RESPONSE.size:
+            magic, status = _AES67_RESPONSE.unpack_from(resp)
+            if magic == 0x2801:
                 if status == 1:
                     return True
                 LOGGER.warning(
@@ -669,44 +1217,26 @@ class DanteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     status, device_ip, rx_channel,
                 )
                 return False
-            LOGGER.warning("AES67 subscribe unexpected response from %s", device_ip)
-            return False
-        except socket.timeout:
-            LOGGER.warning("AES67 subscribe timeout from %s", device_ip)
-            return False
-        finally:
-            sock.close()
+        LOGGER.warning("AES67 subscribe unexpected response from %s", device_ip)
+        return False
 
     def get_aes67_stream_info(self, option: str) -> tuple[dict[str, Any], int] | None:
-        """Parse an AES67 option string and return (stream_info, flow_channel_index).
+        """Return (stream_info, flow_channel_index) for an AES67 option string.
 
         Option format: '[AES67] StreamName - ChannelName'
         """
-        # Strip prefix
-        rest = option[8:]  # after "[AES67] "
-        if " - " not in rest:
-            return None
-        stream_name, ch_name = rest.rsplit(" - ", 1)
+        return self._aes67_option_index.get(option)
 
-        stream_info = self._aes67_streams.get(stream_name)
-        if not stream_info:
-            return None
-
-        # Find the flow channel index (1-based)
-        ch_names = self._get_channel_names(stream_info)
-        for idx, name in enumerate(ch_names, 1):
-            if name == ch_name:
-                return (stream_info, idx)
-
-        return None
-
-    def _reconcile_aes67_subscriptions(self, result: dict[str, Any]) -> None:
+    def _reconcile_aes67_subscriptions(
+        self, result: dict[str, DanteDeviceSnapshot]
+    ) -> int:
         """Restore _aes67_selections from device subscriptions + SAP streams.
 
         AES67 subscriptions survive restart at the device level, but the
         display-string mapping (_aes67_selections) is runtime-only. After SAP
         discovery populates _aes67_streams, cross-reference each device's
         subscription data against known AES67 streams to rebuild the mapping.
+        Returns the number of selections restored.
         """
         # Build lookups: origin_ip -> stream_info, multicast_addr -> stream_info
         ip_to_stream: dict[str, tuple[str, dict]] = {}
@@ -719,7 +1249,8 @@ class DanteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         reconciled = 0
         for dev_name, dev_data in result.items():
-            for sub in dev_data.get("subscriptions", []):
+            rx_by_name: dict[str, int] | None = None
+            for sub in dev_data.subscriptions:
                 tx_dev = sub.get("tx_device_name", "")
                 tx_ch = sub.get("tx_channel_name", "")
                 rx_ch_name = sub.get("rx_channel_name", "")
@@ -731,12 +1262,13 @@ class DanteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
                 stream_name, stream_info = match
 
-                # Find the RX channel number from its name
-                rx_num = None
-                for num, ch in dev_data.get("rx_channels", {}).items():
-                    if ch.get("name") == rx_ch_name:
-                        rx_num = num
-                        break
+                # Find the RX channel number from its name (index built once
+                # per device, first channel wins on duplicate names)
+                if rx_by_name is None:
+                    rx_by_name = {}
+                    for num, ch in dev_data.rx_channels.items():
+                        rx_by_name.setdefault(ch.get("name"), num)
+                rx_num = rx_by_name.get(rx_ch_name)
                 if rx_num is None:
                     continue
 
@@ -771,7 +1303,8 @@ class DanteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 )
 
         if reconciled:
-            LOGGER.warning(
+            LOGGER.debug(
                 "Reconciled %d AES67 subscription(s) from device state",
                 reconciled,
             )
+        return reconciled
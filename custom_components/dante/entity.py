@@ -1,11 +1,14 @@
 """Base entity for Dante Audio Network."""
 from __future__ import annotations
 
+import sys
+
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import DanteDataUpdateCoordinator
+from .coordinator import DanteDataUpdateCoordinator, DanteDeviceSnapshot
 
 
 class DanteEntity(CoordinatorEntity[DanteDataUpdateCoordinator]):
@@ -20,34 +23,59 @@ class DanteEntity(CoordinatorEntity[DanteDataUpdateCoordinator]):
     ) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
-        self._device_name = device_name
+        # Interned: shared by every entity of the device and used as a dict key
+        self._device_name = sys.intern(device_name)
+        # This device's snapshot, looked up once per coordinator update
+        self._device_data: DanteDeviceSnapshot | None = (
+            coordinator.data.devices.get(device_name)
+            if coordinator.data is not None
+            else None
+        )
+        # Last DeviceInfo and the snapshot fields it was built from
+        self._cached_device_info: DeviceInfo | None = None
+        self._cached_info_key: tuple | None = None
 
     @property
-    def device_data(self) -> dict | None:
+    def device_data(self) -> DanteDeviceSnapshot | None:
         """Get the device data from coordinator."""
-        if self.coordinator.data:
-            return self.coordinator.data.get(self._device_name)
-        return None
+        return self._device_data
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Take this device's snapshot from the new coordinator data."""
+        data = self.coordinator.data
+        self._device_data = (
+            data.devices.get(self._device_name) if data is not None else None
+        )
+        self._update_from_device_data()
+        super()._handle_coordinator_update()
+
+    def _update_from_device_data(self) -> None:
+        """Refresh state derived from the device snapshot (for subclasses)."""
 
     @property
     def device_info(self) -> DeviceInfo | None:
         """Return device info."""
-        data = self.device_data
+        data = self._device_data
         if not data:
             return None
-        # Use server_name as the sole stable identifier.
-        # The mac_address from mDNS varies in format between service types
-        # (_netaudio-cmc vs _netaudio-arc) causing duplicate devices and
-        # device registry churn that blocks the UI.
-        return DeviceInfo(
-            identifiers={(DOMAIN, data["server_name"])},
-            name=data["name"],
-            manufacturer=data.get("manufacturer"),
-            model=data.get("model"),
-            sw_version=data.get("software"),
-        )
+        key = (data.server_name, data.name, data.manufacturer, data.model, data.software)
+        if key != self._cached_info_key:
+            # Use server_name as the sole stable identifier.
+            # The mac_address from mDNS varies in format between service types
+            # (_netaudio-cmc vs _netaudio-arc) causing duplicate devices and
+            # device registry churn that blocks the UI.
+            self._cached_device_info = DeviceInfo(
+                identifiers={(DOMAIN, data.server_name)},
+                name=data.name,
+                manufacturer=data.manufacturer,
+                model=data.model,
+                sw_version=data.software,
+            )
+            self._cached_info_key = key
+        return self._cached_device_info
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return super().available and self.device_data is not None
+        return super().available and self._device_data is not None
@@ -1,38 +1,75 @@
+import asyncio
+from collections import OrderedDict
 import logging
+import sys
 import time
-import traceback
 
-import zeroconf as _zc_mod
-from zeroconf import DNSService, IPVersion, ServiceBrowser, ServiceInfo, ServiceStateChange, Zeroconf
+from zeroconf import ServiceStateChange, Zeroconf
+from zeroconf.asyncio import AsyncServiceBrowser, AsyncServiceInfo, AsyncZeroconf
 
 from .device import DanteDevice
 from .const import SERVICE_CMC, SERVICES
 
 logger = logging.getLogger("netaudio")
 
-# HA monkey-patches Zeroconf.__new__ and __init__.
-# Use the original from zeroconf._core which HA doesn't patch.
-from zeroconf._core import Zeroconf as _CoreZeroconf
-_real_init = _CoreZeroconf.__init__
+def _normalize_server_name(server_name: str) -> str:
+    """Strip the trailing dot and .local suffix from an mDNS host name."""
+    return server_name.removesuffix(".").removesuffix(".local")
 
 
-class _RealZeroconf(Zeroconf):
-    """Zeroconf subclass that bypasses HA's constructor patch."""
+def _set_mac_address(device: DanteDevice, value: str, service: dict) -> None:
+    # Only the CMC service's id is the MAC address
+    if service["type"] == SERVICE_CMC:
+        device.mac_address = value
 
-    def __new__(cls, *args, **kwargs):
-        return object.__new__(cls)
 
-    def __init__(self, **kwargs):
-        _real_init(self, **kwargs)
+def _set_model_id(device: DanteDevice, value: str, service: dict) -> None:
+    device.model_id = value
+
+
+def _set_sample_rate(device: DanteDevice, value: str, service: dict) -> None:
+    device.sample_rate = int(value)
+
+
+def _set_latency(device: DanteDevice, value: str, service: dict) -> None:
+    device.latency = int(value)
+
+
+def _set_software(device: DanteDevice, value: str, service: dict) -> None:
+    if value == '"Dante Via"':
+        device.software = "Dante Via"
+
+
+# TXT property name -> handler applying it to the device being built
+_PROPERTY_HANDLERS = {
+    "id": _set_mac_address,
+    "model": _set_model_id,
+    "rate": _set_sample_rate,
+    "latency_ns": _set_latency,
+    "router_info": _set_software,
+}
 
 
 class DanteBrowser:
-    """Discover Dante devices via mDNS using sync Zeroconf."""
+    """Discover Dante devices via mDNS on a shared AsyncZeroconf instance.
+
+    Pass Home Assistant's instance (zeroconf.async_get_async_instance) so
+    discovery shares its sockets and record cache.
+    """
 
-    def __init__(self, mdns_timeout: float) -> None:
+    def __init__(self, mdns_timeout: float, aiozc: AsyncZeroconf) -> None:
         self._devices = {}
         self._raw_services = []
         self._mdns_timeout: float = mdns_timeout
+        self._quiet_period: float = 0.5
+        self._aiozc = aiozc
+        # (service_type, name) -> (resolved at, service data), LRU ordered
+        self._resolve_cache: OrderedDict[tuple[str, str], tuple[float, dict]] = OrderedDict()
+        self._resolve_ttl: float = 120.0
+        self._resolve_cache_size = 1024
+        # (service_type, name) -> time until which a failed resolve is not retried
+        self._neg_cache: dict[tuple[str, str], float] = {}
+        self._neg_ttl: float = 60.0
 
     @property
     def devices(self):
@@ -42,91 +79,63 @@ class DanteBrowser:
     def services(self):
         return self._raw_services
 
-    def get_devices(self) -> dict:
-        """Discover Dante devices (blocking, run in a thread)."""
-        zc = _RealZeroconf(ip_version=IPVersion.V4Only)
-        try:
-            return self._browse(zc)
-        finally:
-            # Use real close, not HA's no-op
-            if hasattr(zc, 'ha_close'):
-                zc.ha_close()
-            else:
-                zc.close()
-
-    def _browse(self, zc: Zeroconf) -> dict:
+    def invalidate(self, service_type: str, name: str) -> None:
+        """Drop a cached resolve so the next browse resolves the service again."""
+        self._resolve_cache.pop((service_type, name), None)
+        self._neg_cache.pop((service_type, name), None)
+
+    async def get_devices(self) -> dict:
+        """Discover Dante devices."""
+        return await self._browse(self._aiozc.zeroconf)
+
+    async def _browse(self, zc: Zeroconf) -> dict:
+        now = time.monotonic()
+        self._neg_cache = {k: exp for k, exp in self._neg_cache.items() if exp > now}
+
+        loop = asyncio.get_running_loop()
         discovered = []
+        last_add = None
 
         def on_change(**kwargs):
+            nonlocal last_add
             state_change = kwargs.get("state_change")
             name = kwargs.get("name")
             service_type = kwargs.get("service_type")
             if state_change is ServiceStateChange.Added:
                 discovered.append((service_type, name))
-
-        browser = ServiceBrowser(zc, SERVICES, handlers=[on_change])
-        time.sleep(self._mdns_timeout)
-        browser.cancel()
+                last_add = loop.time()
+            elif state_change in (ServiceStateChange.Removed, ServiceStateChange.Updated):
+                self.invalidate(service_type, name)
+
+        browser = AsyncServiceBrowser(zc, SERVICES, handlers=[on_change])
+        # Stop once discovery plateaus (no new service for _quiet_period), or
+        # at _mdns_timeout if nothing answers
+        deadline = loop.time() + self._mdns_timeout
+        while (now := loop.time()) < deadline:
+            if last_add is not None and now - last_add >= self._quiet_period:
+                break
+            await asyncio.sleep(0.1)
+        await browser.async_cancel()
 
         self._raw_services = discovered
         logger.debug("Found %d raw services", len(discovered))
 
-        # Resolve each service and group by host
+        # Resolve all services concurrently and group by host
+        results = await asyncio.gather(
+            *(self._resolve(zc, service_type, name) for service_type, name in discovered),
+            return_exceptions=True,
+        )
+
         device_hosts = {}
 
-        for service_type, name in discovered:
-            try:
-                info = ServiceInfo(service_type, name)
-                if not info.request(zc, 3000):
-                    logger.warning("Could not resolve service %s", name)
-                    continue
-
-                addresses = info.parsed_addresses()
-                if not addresses:
-                    continue
-
-                ipv4 = addresses[0]
-
-                service_properties = {}
-                for key, value in info.properties.items():
-                    if isinstance(key, bytes):
-                        key = key.decode("utf-8")
-                    if isinstance(value, bytes):
-                        value = value.decode("utf-8")
-                    service_properties[key] = value
-
-                # Get server_name from cache DNS records
-                server_name = None
-                cache_entries = zc.cache.entries_with_name(name)
-                for record in cache_entries:
-                    if isinstance(record, DNSService):
-                        server_name = record.server
-                        break
-
-                if not server_name:
-                    # Fallback: derive from service name
-                    server_name = name.split(".")[0] if "." in name else name
-
-                # Normalize: strip trailing dot and .local suffix
-                server_name = server_name.rstrip(".")
-                if server_name.endswith(".local"):
-                    server_name = server_name[:-6]
-
-                service_data = {
-                    "ipv4": ipv4,
-                    "name": name,
-                    "port": info.port,
-                    "properties": service_properties,
-                    "server_name": server_name,
-                    "type": service_type,
-                }
-
-                if server_name not in device_hosts:
-                    device_hosts[server_name] = {}
-                device_hosts[server_name][name] = service_data
-
-            except Exception as e:
-                logger.warning("Error resolving service %s: %s", name, e)
+        for (_, name), service_data in zip(discovered, results):
+            if isinstance(service_data, Exception):
+                logger.warning("Error resolving service %s: %s", name, service_data)
+                continue
+            if service_data is None:
+                continue
+
+            device_hosts.setdefault(service_data["server_name"], {})[name] = service_data
 
         logger.debug("Found %d device host(s)", len(device_hosts))
 
@@ -134,36 +143,81 @@ class DanteBrowser:
         for hostname, device_services in device_hosts.items():
             device = DanteDevice(server_name=hostname)
 
-            try:
-                for service_name, service in device_services.items():
-                    device.services[service_name] = service
-                    service_properties = service["properties"]
-
-                    if not device.ipv4:
-                        device.ipv4 = service["ipv4"]
+            for service_name, service in device_services.items():
+                device.services[service_name] = service
 
-                    if "id" in service_properties and service["type"] == SERVICE_CMC:
-                        device.mac_address = service_properties["id"]
+                if not device.ipv4:
+                    device.ipv4 = service["ipv4"]
 
-                    if "model" in service_properties:
-                        device.model_id = service_properties["model"]
-
-                    if "rate" in service_properties:
-                        device.sample_rate = int(service_properties["rate"])
-
-                    if (
-                        "router_info" in service_properties
-                        and service_properties["router_info"] == '"Dante Via"'
-                    ):
-                        device.software = "Dante Via"
-
-                    if "latency_ns" in service_properties:
-                        device.latency = int(service_properties["latency_ns"])
-
-            except Exception as e:
-                logger.warning("Error building device %s: %s", hostname, e)
-                traceback.print_exc()
+                for key, value in service["properties"].items():
+                    handler = _PROPERTY_HANDLERS.get(key)
+                    if handler is None:
+                        continue
+                    try:
+                        handler(device, value, service)
+                    except (TypeError, ValueError) as e:
+                        logger.warning(
+                            "Error building device %s: bad %s %r: %s",
+                            hostname, key, value, e,
+                        )
 
             self._devices[hostname] = device
 
         return self._devices
+
+    async def _resolve(self, zc: Zeroconf, service_type: str, name: str) -> dict | None:
+        """Resolve one service into its service data, or None if unresolvable.
+
+        Results are reused for up to _resolve_ttl seconds.
+        """
+        key = (service_type, name)
+        entry = self._resolve_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self._resolve_ttl:
+            self._resolve_cache.move_to_end(key)
+            return entry[1]
+
+        # Recently failed: skip instead of waiting out another 3 s timeout
+        expires = self._neg_cache.get(key)
+        if expires is not None and expires > time.monotonic():
+            return None
+
+        info = AsyncServiceInfo(service_type, name)
+        if not await info.async_request(zc, 3000):
+            logger.warning("Could not resolve service %s", name)
+            self._neg_cache[key] = time.monotonic() + self._neg_ttl
+            return None
+
+        addresses = info.parsed_addresses()
+        if not addresses:
+            return None
+
+        ipv4 = addresses[0]
+
+        # zeroconf keys are always bytes; values are bytes, or None for a bare key.
+        # Keys repeat across every device, so intern them.
+        service_properties = {
+            sys.intern(key.decode("utf-8", "replace")): (
+                value.decode("utf-8", "replace") if value is not None else None
+            )
+            for key, value in info.properties.items()
+        }
+
+        # The SRV record loaded by async_request names the host; no need to
+        # walk the zeroconf cache for it
+        server_name = _normalize_server_name(info.server or name.partition(".")[0])
+
+        service_data = {
+            "ipv4": ipv4,
+            "name": name,
+            "port": info.port,
+            "properties": service_properties,
+            "server_name": server_name,
+            "type": service_type,
+        }
+
+        self._resolve_cache[key] = (time.monotonic(), service_data)
+        self._resolve_cache.move_to_end(key)
+        if len(self._resolve_cache) > self._resolve_cache_size:
+            self._resolve_cache.popitem(last=False)
+
+        return service_data
@@ -33,4 +33,6 @@ DEVICE_CONTROL_PORT: int = 8800
 DEVICE_INFO_PORT: int = 8702
 DEVICE_SETTINGS_PORT: int = 8700
 
+COMMAND_TIMEOUT: float = 1.0
+
 PORTS = [DEVICE_CONTROL_PORT, DEVICE_INFO_PORT, DEVICE_SETTINGS_PORT]
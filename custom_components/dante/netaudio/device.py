@@ -1,14 +1,15 @@
+import asyncio
 import codecs
 import ipaddress
 import logging
 import random
 import socket
-import traceback
 
 from .channel import DanteChannel
 from .subscription import DanteSubscription
 
 from .const import (
+    COMMAND_TIMEOUT,
     DEVICE_CONTROL_PORT,
     DEVICE_SETTINGS_PORT,
     FEATURE_VOLUME_UNSUPPORTED,
@@ -27,6 +28,7 @@ class DanteDevice:
         self._dante_model_id = ""
         self._error = None
         self._ipv4 = None
+        self._ipv4_str = None
         self._latency = None
         self._mac_address = None
         self._manufacturer = ""
@@ -40,6 +42,9 @@ class DanteDevice:
         self._server_name = server_name
         self._services = {}
         self._sockets = {}
+        # One command in flight per socket: concurrent sock_recv calls on the
+        # same fd would steal each other's replies
+        self._socket_locks = {}
         self._software = None
         self._subscriptions = []
         self._tx_channels = {}
@@ -69,9 +74,8 @@ class DanteDevice:
 
         try:
             sock.send(binary_str)
-        except Exception as e:
-            print(e)
-            traceback.print_exc()
+        except Exception:
+            logger.debug("Failed to send command to %s", self.name, exc_info=True)
 
     async def dante_command(self, command, service_type=None, port=None):
         response = None
@@ -90,12 +94,20 @@ class DanteDevice:
             return
 
         binary_str = codecs.decode(command, "hex")
+        loop = asyncio.get_running_loop()
 
-        try:
-            sock.send(binary_str)
-            response = sock.recvfrom(2048)[0]
-        except TimeoutError:
-            pass
+        lock = self._socket_locks.get(sock)
+        if lock is None:
+            lock = self._socket_locks[sock] = asyncio.Lock()
+
+        async with lock:
+            try:
+                await loop.sock_sendall(sock, binary_str)
+                response = await asyncio.wait_for(
+                    loop.sock_recv(sock, 2048), COMMAND_TIMEOUT
+                )
+            except TimeoutError:
+                pass
 
         return response
 
@@ -170,23 +182,13 @@ class DanteDevice:
         return response
 
     def get_service(self, service_type):
-        service = None
+        for service in self.services.values():
+            if service and service.get("type") == service_type:
+                return service
 
-        try:
-            service = next(
-                filter(
-                    lambda x: x
-                    and x[1]
-                    and "type" in x[1]
-                    and x[1]["type"] == service_type,
-                    self.services.items(),
-                )
-            )[1]
-        except Exception as e:
-            logger.warning(f"Failed to get a service by type. {e}")
-            self.error = e
+        logger.debug("No %s service for %s", service_type, self.server_name)
 
-        return service
+        return None
 
     #  @on("init")
     #  def event_handler(self, *args, **kwargs):
@@ -257,8 +259,8 @@ class DanteDevice:
 
                 sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
                 sock.bind(("", 0))
-                sock.settimeout(1)
-                sock.connect((str(self.ipv4), service["port"]))
+                sock.setblocking(False)
+                sock.connect((self.ipv4_str, service["port"]))
                 self.sockets[service["port"]] = sock
 
             for port in PORTS:
@@ -266,13 +268,12 @@ class DanteDevice:
                     continue
                 sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
                 sock.bind(("", 0))
-                sock.settimeout(1)
-                sock.connect((str(self.ipv4), port))
+                sock.setblocking(False)
+                sock.connect((self.ipv4_str, port))
                 self.sockets[port] = sock
         except Exception as e:
             self.error = e
-            print(e)
-            traceback.print_exc()
+            logger.debug("Failed to open control sockets for %s", self.name, exc_info=True)
 
         try:
             if not self.name:
@@ -307,8 +308,7 @@ class DanteDevice:
             self.error = None
         except Exception as e:
             self.error = e
-            print(e)
-            traceback.print_exc()
+            logger.debug("Failed to get controls for %s", self.name, exc_info=True)
 
     def parse_volume(self, bytes_volume):
         rx_channels = bytes_volume[-1 - self.rx_count_raw : -1]
@@ -323,9 +323,8 @@ class DanteDevice:
             for _, channel in self.rx_channels.items():
                 channel.volume = rx_channels[channel.number - 1]
 
-        except Exception as e:
-            print(e)
-            traceback.print_exc()
+        except Exception:
+            logger.debug("Failed to parse volume levels for %s", self.name, exc_info=True)
 
     async def get_volume(self, ipv4, mac, port):
         try:
@@ -353,7 +352,7 @@ class DanteDevice:
                 try:
                     data, addr = sock.recvfrom(2048)
 
-                    if addr[0] == str(self.ipv4):
+                    if addr[0] == self.ipv4_str:
                         await self.dante_send_command(
                             *self.command_volume_stop(self.name, ipv4, mac, port)
                         )
@@ -362,14 +361,12 @@ class DanteDevice:
                     break
                 except socket.timeout:
                     break
-                except Exception as e:
-                    print(e)
-                    traceback.print_exc()
+                except Exception:
+                    logger.debug("Failed to read volume levels from %s", self.name, exc_info=True)
                     break
 
-        except Exception as e:
-            traceback.print_exc()
-            print(e)
+        except Exception:
+            logger.debug("Failed to get volume levels for %s", self.name, exc_info=True)
 
     async def get_rx_channels(self):
         rx_channels = {}
@@ -447,8 +444,7 @@ class DanteDevice:
                             subscriptions.append(subscription)
         except Exception as e:
             self.error = e
-            print(e)
-            traceback.print_exc()
+            logger.debug("Failed to get RX channels for %s", self.name, exc_info=True)
 
         self.rx_channels = rx_channels
         self.subscriptions = subscriptions
@@ -549,8 +545,7 @@ class DanteDevice:
 
         except Exception as e:
             self.error = e
-            print(e)
-            traceback.print_exc()
+            logger.debug("Failed to get TX channels for %s", self.name, exc_info=True)
 
         self.tx_channels = tx_channels
 
@@ -561,6 +556,11 @@ class DanteDevice:
     @ipv4.setter
     def ipv4(self, ipv4):
         self._ipv4 = ipaddress.ip_address(ipv4)
+        self._ipv4_str = str(self._ipv4)
+
+    @property
+    def ipv4_str(self):
+        return self._ipv4_str
 
     @property
     def dante_model(self):
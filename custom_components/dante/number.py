@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
@@ -26,47 +27,50 @@ async def async_setup_entry(
     """Set up Dante number entities."""
     coordinator: DanteDataUpdateCoordinator = entry.runtime_data
     platform = "number"
-    coordinator.setdefault_known_devices(platform)
 
+    @callback
     def _add_new_devices() -> None:
         """Add entities for any newly discovered devices."""
-        if not coordinator.data:
-            return
         new_entities: list[NumberEntity] = []
-        for device_name, dev_data in coordinator.data.items():
-            if device_name not in coordinator._platform_known_devices[platform]:
-                coordinator._platform_known_devices[platform].add(device_name)
-                new_entities.append(
-                    DanteLatencyNumber(coordinator, device_name)
-                )
-                model_id = dev_data.get("model_id")
-                if model_id in AVIO_INPUT_MODELS:
-                    for ch_num, ch_data in dev_data.get("tx_channels", {}).items():
-                        new_entities.append(
-                            DanteGainNumber(
-                                coordinator,
-                                device_name,
-                                ch_num,
-                                ch_data["name"],
-                                "input",
-                            )
+        for device_name in coordinator.take_new_devices(platform):
+            dev_data = coordinator.data.devices.get(device_name)
+            if dev_data is None:
+                continue
+            new_entities.append(
+                DanteLatencyNumber(coordinator, device_name)
+            )
+            model_id = dev_data.model_id
+            if model_id in AVIO_INPUT_MODELS:
+                for ch_num, ch_data in dev_data.tx_channels.items():
+                    new_entities.append(
+                        DanteGainNumber(
+                            coordinator,
+                            device_name,
+                            ch_num,
+                            ch_data["name"],
+                            "input",
                         )
-                elif model_id in AVIO_OUTPUT_MODELS:
-                    for ch_num, ch_data in dev_data.get("rx_channels", {}).items():
-                        new_entities.append(
-                            DanteGainNumber(
-                                coordinator,
-                                device_name,
-                                ch_num,
-                                ch_data["name"],
-                                "output",
-                            )
+                    )
+            elif model_id in AVIO_OUTPUT_MODELS:
+                for ch_num, ch_data in dev_data.rx_channels.items():
+                    new_entities.append(
+                        DanteGainNumber(
+                            coordinator,
+                            device_name,
+                            ch_num,
+                            ch_data["name"],
+                            "output",
                         )
+                    )
         if new_entities:
-            async_add_entities(new_entities, update_before_add=True)
+            async_add_entities(new_entities)
 
     _add_new_devices()
-    entry.async_on_unload(coordinator.async_add_listener(lambda: _add_new_devices()))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, coordinator.new_devices_signal, _add_new_devices
+        )
+    )
 
 
 class DanteLatencyNumber(DanteEntity, NumberEntity):
@@ -93,9 +97,9 @@ class DanteLatencyNumber(DanteEntity, NumberEntity):
     def native_value(self) -> float | None:
         """Return the current latency in ms."""
         data = self.device_data
-        if data and data.get("latency") is not None:
+        if data and data.latency is not None:
             # Library stores latency in nanoseconds; convert to ms
-            return data["latency"] / 1_000_000
+            return data.latency / 1_000_000
         return None
 
     async def async_set_native_value(self, value: float) -> None:
@@ -106,7 +110,7 @@ class DanteLatencyNumber(DanteEntity, NumberEntity):
 
         try:
             await device.set_latency(value)
-            await self.coordinator.async_request_refresh()
+            self.coordinator.async_schedule_setter_refresh()
         except Exception as err:
             LOGGER.error(
                 "Failed to set latency on %s: %s", self._device_name, err
@@ -161,7 +165,7 @@ class DanteGainNumber(DanteEntity, NumberEntity):
             await device.set_gain_level(
                 self._channel_num, int(value), self._device_type
             )
-            await self.coordinator.async_request_refresh()
+            self.coordinator.async_schedule_setter_refresh()
         except Exception as err:
             LOGGER.error(
                 "Failed to set gain on %s ch %s: %s",
@@ -5,21 +5,28 @@ from typing import Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     DOMAIN,
     ENCODINGS,
+    ENCODING_BY_LABEL,
     ENCODING_LABELS,
     LOGGER,
     SAMPLE_RATES,
+    SAMPLE_RATE_BY_LABEL,
     SAMPLE_RATE_LABELS,
     SUBSCRIPTION_NONE,
 )
 from .coordinator import DanteDataUpdateCoordinator
 from .entity import DanteEntity
 
+# Built once and shared by every device's select (never mutated)
+_SAMPLE_RATE_OPTIONS = [SAMPLE_RATE_LABELS[r] for r in SAMPLE_RATES]
+_ENCODING_OPTIONS = [ENCODING_LABELS[e] for e in ENCODINGS]
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -29,33 +36,36 @@ async def async_setup_entry(
     """Set up Dante select entities."""
     coordinator: DanteDataUpdateCoordinator = entry.runtime_data
     platform = "select"
-    coordinator.setdefault_known_devices(platform)
 
+    @callback
     def _add_new_devices() -> None:
         """Add entities for any newly discovered devices."""
-        if not coordinator.data:
-            return
         new_entities: list[SelectEntity] = []
-        for device_name, dev_data in coordinator.data.items():
-            if device_name not in coordinator._platform_known_devices[platform]:
-                coordinator._platform_known_devices[platform].add(device_name)
-                new_entities.append(
-                    DanteSampleRateSelect(coordinator, device_name)
-                )
+        for device_name in coordinator.take_new_devices(platform):
+            dev_data = coordinator.data.devices.get(device_name)
+            if dev_data is None:
+                continue
+            new_entities.append(
+                DanteSampleRateSelect(coordinator, device_name)
+            )
+            new_entities.append(
+                DanteEncodingSelect(coordinator, device_name)
+            )
+            for ch_num, ch_data in dev_data.rx_channels.items():
                 new_entities.append(
-                    DanteEncodingSelect(coordinator, device_name)
-                )
-                for ch_num, ch_data in dev_data.get("rx_channels", {}).items():
-                    new_entities.append(
-                        DanteSubscriptionSelect(
-                            coordinator, device_name, ch_num, ch_data["name"]
-                        )
+                    DanteSubscriptionSelect(
+                        coordinator, device_name, ch_num, ch_data["name"]
                     )
+                )
         if new_entities:
-            async_add_entities(new_entities, update_before_add=True)
+            async_add_entities(new_entities)
 
     _add_new_devices()
-    entry.async_on_unload(coordinator.async_add_listener(lambda: _add_new_devices()))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, coordinator.new_devices_signal, _add_new_devices
+        )
+    )
 
 
 class DanteSampleRateSelect(DanteEntity, SelectEntity):
@@ -72,20 +82,19 @@ class DanteSampleRateSelect(DanteEntity, SelectEntity):
         """Initialize the select."""
         super().__init__(coordinator, device_name)
         self._attr_unique_id = f"{DOMAIN}_{device_name}_sample_rate_select"
-        self._attr_options = [SAMPLE_RATE_LABELS[r] for r in SAMPLE_RATES]
+        self._attr_options = _SAMPLE_RATE_OPTIONS
 
     @property
     def current_option(self) -> str | None:
         """Return the current sample rate."""
         data = self.device_data
-        if data and data.get("sample_rate"):
-            return SAMPLE_RATE_LABELS.get(data["sample_rate"])
+        if data and data.sample_rate:
+            return SAMPLE_RATE_LABELS.get(data.sample_rate)
         return None
 
     async def async_select_option(self, option: str) -> None:
         """Set the sample rate."""
-        rate_map = {v: k for k, v in SAMPLE_RATE_LABELS.items()}
-        rate = rate_map.get(option)
+        rate = SAMPLE_RATE_BY_LABEL.get(option)
         if rate is None:
             return
 
@@ -95,7 +104,7 @@ class DanteSampleRateSelect(DanteEntity, SelectEntity):
 
         try:
             await device.set_sample_rate(rate)
-            await self.coordinator.async_request_refresh()
+            self.coordinator.async_schedule_setter_refresh()
         except Exception as err:
             LOGGER.error(
                 "Failed to set sample rate on %s: %s", self._device_name, err
@@ -116,7 +125,7 @@ class DanteEncodingSelect(DanteEntity, SelectEntity):
         """Initialize the select."""
         super().__init__(coordinator, device_name)
         self._attr_unique_id = f"{DOMAIN}_{device_name}_encoding_select"
-        self._attr_options = [ENCODING_LABELS[e] for e in ENCODINGS]
+        self._attr_options = _ENCODING_OPTIONS
 
     @property
     def current_option(self) -> str | None:
@@ -127,8 +136,7 @@ class DanteEncodingSelect(DanteEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Set the encoding."""
-        enc_map = {v: k for k, v in ENCODING_LABELS.items()}
-        encoding = enc_map.get(option)
+        encoding = ENCODING_BY_LABEL.get(option)
         if encoding is None:
             return
 
@@ -138,7 +146,7 @@ class DanteEncodingSelect(DanteEntity, SelectEntity):
 
         try:
             await device.set_encoding(encoding)
-            await self.coordinator.async_request_refresh()
+            self.coordinator.async_schedule_setter_refresh()
         except Exception as err:
             LOGGER.error(
                 "Failed to set encoding on %s: %s", self._device_name, err
@@ -166,13 +174,12 @@ class DanteSubscriptionSelect(DanteEntity, SelectEntity):
         )
         self._attr_name = f"RX {rx_channel_num} ({rx_channel_name})"
         self._pending_option: str | None = None
-
-    @property
-    def options(self) -> list[str]:
-        """Return all available TX channels and AES67 streams as options."""
-        tx_options = self.coordinator.get_all_tx_channels()
-        aes67_options = self.coordinator.get_all_aes67_sources()
-        return [SUBSCRIPTION_NONE] + tx_options + aes67_options
+        # Pre-bound: read on every state write
+        self._selection_key = (device_name, rx_channel_num)
+        self._aes67_selections = coordinator._aes67_selections
+        # Shared coordinator list; refreshed only when its version changes
+        self._options_version = coordinator.options_version
+        self._attr_options = coordinator.get_subscription_options()
 
     @property
     def current_option(self) -> str | None:
@@ -182,8 +189,7 @@ class DanteSubscriptionSelect(DanteEntity, SelectEntity):
             return self._pending_option
 
         # Check for local AES67 selection first
-        key = (self._device_name, self._rx_channel_num)
-        aes67_sel = self.coordinator._aes67_selections.get(key)
+        aes67_sel = self._aes67_selections.get(self._selection_key)
         if aes67_sel:
             return aes67_sel
 
@@ -191,17 +197,17 @@ class DanteSubscriptionSelect(DanteEntity, SelectEntity):
         if not data:
             return SUBSCRIPTION_NONE
 
-        for sub in data.get("subscriptions", []):
-            if sub.get("rx_channel_name") == self._rx_channel_name:
-                tx_dev = sub.get("tx_device_name")
-                tx_ch = sub.get("tx_channel_name")
-                if tx_dev and tx_ch:
-                    return f"{tx_dev} - {tx_ch}"
+        sub = data.subscriptions_by_rx.get(self._rx_channel_name)
+        if sub is not None:
+            return f"{sub['tx_device_name']} - {sub['tx_channel_name']}"
         return SUBSCRIPTION_NONE
 
     def _handle_coordinator_update(self) -> None:
         """Clear pending option when coordinator refreshes with real data."""
         self._pending_option = None
+        if self._options_version != self.coordinator.options_version:
+            self._options_version = self.coordinator.options_version
+            self._attr_options = self.coordinator.get_subscription_options()
         super()._handle_coordinator_update()
 
     async def async_select_option(self, option: str) -> None:
@@ -219,15 +225,15 @@ class DanteSubscriptionSelect(DanteEntity, SelectEntity):
             )
             return
 
-        key = (self._device_name, self._rx_channel_num)
+        key = self._selection_key
 
         if option == SUBSCRIPTION_NONE:
-            self.coordinator._aes67_selections.pop(key, None)
+            self._aes67_selections.pop(key, None)
             try:
                 await device.remove_subscription(rx_ch)
                 self._pending_option = SUBSCRIPTION_NONE
                 self.async_write_ha_state()
-                await self.coordinator.async_request_refresh()
+                self.coordinator.async_schedule_setter_refresh()
             except Exception as err:
                 LOGGER.error(
                     "Failed to remove subscription on %s ch %s: %s",
@@ -244,7 +250,7 @@ class DanteSubscriptionSelect(DanteEntity, SelectEntity):
                 return
 
             stream_info, flow_channel = result
-            device_ip = self.device_data.get("ipv4") if self.device_data else None
+            device_ip = self.device_data.ipv4 if self.device_data else None
             if not device_ip:
                 LOGGER.error("No IP for device %s", self._device_name)
                 return
@@ -263,8 +269,10 @@ class DanteSubscriptionSelect(DanteEntity, SelectEntity):
                     stream_info,
                 )
                 if success:
-                    self.coordinator._aes67_selections[key] = option
-                    LOGGER.warning(
+                    self._aes67_selections[key] = option
+                    # The selection now reports this option by itself
+                    self._pending_option = None
+                    LOGGER.debug(
                         "AES67 subscribed %s ch %d -> %s (flow ch %d)",
                         self._device_name,
                         self._rx_channel_num,
@@ -292,7 +300,7 @@ class DanteSubscriptionSelect(DanteEntity, SelectEntity):
             return
 
         # Clear any AES67 override when switching to a Dante source
-        self.coordinator._aes67_selections.pop(key, None)
+        self._aes67_selections.pop(key, None)
 
         # Parse "DeviceName - ChannelName"
         if " - " not in option:
@@ -304,13 +312,7 @@ class DanteSubscriptionSelect(DanteEntity, SelectEntity):
             LOGGER.error("TX device not found: %s", tx_device_name)
             return
 
-        tx_ch = None
-        if tx_device.tx_channels:
-            for ch in tx_device.tx_channels.values():
-                if ch.name == tx_channel_name:
-                    tx_ch = ch
-                    break
-
+        tx_ch = self.coordinator.get_tx_channel(tx_device_name, tx_channel_name)
         if not tx_ch:
             LOGGER.error(
                 "TX channel %s not found on %s", tx_channel_name, tx_device_name
@@ -323,7 +325,7 @@ class DanteSubscriptionSelect(DanteEntity, SelectEntity):
             self._pending_option = option
             self.async_write_ha_state()
             # Background refresh for eventual consistency
-            await self.coordinator.async_request_refresh()
+            self.coordinator.async_schedule_setter_refresh()
         except Exception as err:
             LOGGER.error(
                 "Failed to add subscription on %s ch %s: %s",
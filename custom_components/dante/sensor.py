@@ -7,11 +7,12 @@ from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
-from .coordinator import DanteDataUpdateCoordinator
+from .coordinator import DanteDataUpdateCoordinator, DanteDeviceSnapshot
 from .entity import DanteEntity
 
 
@@ -19,7 +20,7 @@ from .entity import DanteEntity
 class DanteSensorEntityDescription(SensorEntityDescription):
     """Describe a Dante sensor entity."""
 
-    value_fn: Callable[[dict[str, Any]], Any]
+    value_fn: Callable[[DanteDeviceSnapshot], Any]
 
 
 SENSOR_DESCRIPTIONS: tuple[DanteSensorEntityDescription, ...] = (
@@ -27,50 +28,50 @@ SENSOR_DESCRIPTIONS: tuple[DanteSensorEntityDescription, ...] = (
         key="model",
         name="Model",
         icon="mdi:audio-video",
-        value_fn=lambda data: data.get("model"),
+        value_fn=lambda data: data.model,
     ),
     DanteSensorEntityDescription(
         key="manufacturer",
         name="Manufacturer",
         icon="mdi:factory",
-        value_fn=lambda data: data.get("manufacturer"),
+        value_fn=lambda data: data.manufacturer,
     ),
     DanteSensorEntityDescription(
         key="software_version",
         name="Software Version",
         icon="mdi:package-variant",
-        value_fn=lambda data: data.get("software"),
+        value_fn=lambda data: data.software,
     ),
     DanteSensorEntityDescription(
         key="sample_rate",
         name="Sample Rate",
         icon="mdi:sine-wave",
         native_unit_of_measurement="Hz",
-        value_fn=lambda data: data.get("sample_rate"),
+        value_fn=lambda data: data.sample_rate,
     ),
     DanteSensorEntityDescription(
         key="latency",
         name="Latency",
         icon="mdi:timer-outline",
-        value_fn=lambda data: data.get("latency"),
+        value_fn=lambda data: data.latency,
     ),
     DanteSensorEntityDescription(
         key="rx_count",
         name="RX Channels",
         icon="mdi:import",
-        value_fn=lambda data: data.get("rx_count"),
+        value_fn=lambda data: data.rx_count,
     ),
     DanteSensorEntityDescription(
         key="tx_count",
         name="TX Channels",
         icon="mdi:export",
-        value_fn=lambda data: data.get("tx_count"),
+        value_fn=lambda data: data.tx_count,
     ),
     DanteSensorEntityDescription(
         key="ip_address",
         name="IP Address",
         icon="mdi:ip-network",
-        value_fn=lambda data: data.get("ipv4"),
+        value_fn=lambda data: data.ipv4,
     ),
 )
 
@@ -83,25 +84,25 @@ async def async_setup_entry(
     """Set up Dante sensor entities."""
     coordinator: DanteDataUpdateCoordinator = entry.runtime_data
     platform = "sensor"
-    coordinator.setdefault_known_devices(platform)
 
+    @callback
     def _add_new_devices() -> None:
         """Add entities for any newly discovered devices."""
-        if not coordinator.data:
-            return
         new_entities: list[DanteSensor] = []
-        for device_name in coordinator.data:
-            if device_name not in coordinator._platform_known_devices[platform]:
-                coordinator._platform_known_devices[platform].add(device_name)
-                for desc in SENSOR_DESCRIPTIONS:
-                    new_entities.append(
-                        DanteSensor(coordinator, device_name, desc)
-                    )
+        for device_name in coordinator.take_new_devices(platform):
+            for desc in SENSOR_DESCRIPTIONS:
+                new_entities.append(
+                    DanteSensor(coordinator, device_name, desc)
+                )
         if new_entities:
-            async_add_entities(new_entities, update_before_add=True)
+            async_add_entities(new_entities)
 
     _add_new_devices()
-    entry.async_on_unload(coordinator.async_add_listener(lambda: _add_new_devices()))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, coordinator.new_devices_signal, _add_new_devices
+        )
+    )
 
 
 class DanteSensor(DanteEntity, SensorEntity):
@@ -118,12 +119,11 @@ class DanteSensor(DanteEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator, device_name)
         self.entity_description = description
+        self._value_fn = description.value_fn
         self._attr_unique_id = f"{DOMAIN}_{device_name}_{description.key}"
+        self._update_from_device_data()
 
-    @property
-    def native_value(self) -> Any:
-        """Return the sensor value."""
-        data = self.device_data
-        if data is None:
-            return None
-        return self.entity_description.value_fn(data)
+    def _update_from_device_data(self) -> None:
+        """Compute the sensor value once per coordinator update."""
+        data = self._device_data
+        self._attr_native_value = None if data is None else self._value_fn(data)
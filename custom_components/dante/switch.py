@@ -1,14 +1,21 @@
 """Switch platform for Dante Audio Network."""
 from __future__ import annotations
 
+import asyncio
+
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, LOGGER
 from .coordinator import DanteDataUpdateCoordinator
 from .entity import DanteEntity
+from .netaudio.device import DanteDevice
+
+# Probed once: the netaudio library may gain an AES67 toggle in future versions
+_SUPPORTS_SET_AES67 = callable(getattr(DanteDevice, "set_aes67", None))
 
 
 async def async_setup_entry(
@@ -19,24 +26,24 @@ async def async_setup_entry(
     """Set up Dante switch entities."""
     coordinator: DanteDataUpdateCoordinator = entry.runtime_data
     platform = "switch"
-    coordinator.setdefault_known_devices(platform)
 
+    @callback
     def _add_new_devices() -> None:
         """Add entities for any newly discovered devices."""
-        if not coordinator.data:
-            return
         new_entities: list[SwitchEntity] = []
-        for device_name in coordinator.data:
-            if device_name not in coordinator._platform_known_devices[platform]:
-                coordinator._platform_known_devices[platform].add(device_name)
-                new_entities.append(
-                    DanteAES67Switch(coordinator, device_name)
-                )
+        for device_name in coordinator.take_new_devices(platform):
+            new_entities.append(
+                DanteAES67Switch(coordinator, device_name)
+            )
         if new_entities:
-            async_add_entities(new_entities, update_before_add=True)
+            async_add_entities(new_entities)
 
     _add_new_devices()
-    entry.async_on_unload(coordinator.async_add_listener(lambda: _add_new_devices()))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, coordinator.new_devices_signal, _add_new_devices
+        )
+    )
 
 
 class DanteAES67Switch(DanteEntity, SwitchEntity):
@@ -71,14 +78,13 @@ class DanteAES67Switch(DanteEntity, SwitchEntity):
         if not device:
             return
 
-        if hasattr(device, "set_aes67") and callable(device.set_aes67):
+        if _SUPPORTS_SET_AES67:
             try:
                 await device.set_aes67(True)
                 self._is_on = True
                 self.async_write_ha_state()
-                await self.coordinator.async_request_refresh()
                 return
-            except Exception as err:
+            except (OSError, asyncio.TimeoutError) as err:
                 LOGGER.error(
                     "Failed to enable AES67 on %s: %s", self._device_name, err
                 )
@@ -97,14 +103,13 @@ class DanteAES67Switch(DanteEntity, SwitchEntity):
         if not device:
             return
 
-        if hasattr(device, "set_aes67") and callable(device.set_aes67):
+        if _SUPPORTS_SET_AES67:
             try:
                 await device.set_aes67(False)
                 self._is_on = False
                 self.async_write_ha_state()
-                await self.coordinator.async_request_refresh()
                 return
-            except Exception as err:
+            except (OSError, asyncio.TimeoutError) as err:
                 LOGGER.error(
                     "Failed to disable AES67 on %s: %s", self._device_name, err
                 )